@@ -1,5 +1,6 @@
 from app.ai.openai_client import call_llm
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, List, Tuple
+import asyncio
 import json
 import re
 
@@ -69,4 +70,57 @@ Respond ONLY with valid JSON:
                 "risk_level": "medium",
                 "explanation": "Safety analysis temporarily unavailable.",
                 "recommendation": "Proceed with caution and stay alert."
-            }
\ No newline at end of file
+            }
+
+    async def analyze_routes_batch(
+        self,
+        items: Iterable[Tuple[Dict, Dict, List[Dict]]]
+    ) -> List[str]:
+        """
+        Explain the safety of several routes with a single LLM call.
+
+        Each item is a (route, safety_score, unsafe_zones) tuple. Returns one
+        reasoning string per item, in order.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        route_lines = []
+        for idx, (route, safety_score, unsafe_zones) in enumerate(items):
+            zone_types = ", ".join(z.get("type", "unknown") for z in unsafe_zones) or "none"
+            route_lines.append(
+                f"{idx + 1}. {route.get('summary', f'Route {idx + 1}')} | "
+                f"Safety: {safety_score.get('overall_score')}/100 | "
+                f"Crime: {safety_score.get('crime_score')} | "
+                f"Lighting: {safety_score.get('lighting_score')} | "
+                f"Crowd: {safety_score.get('crowd_score')} | "
+                f"Unsafe zones: {zone_types}"
+            )
+
+        prompt = f"""You are a safety reasoning agent for a navigation system.
+
+Routes (safety 0 = very unsafe, 100 = very safe):
+{chr(10).join(route_lines)}
+
+Task:
+For each route, in the same order, give a clear 1–2 sentence explanation
+of its safety and what the traveller should watch out for.
+
+Respond ONLY with a valid JSON array of exactly {len(items)} strings."""
+
+        # call_llm is blocking; keep it off the event loop
+        response = await asyncio.to_thread(call_llm, prompt, max_tokens=150 * len(items))
+
+        fallback = "Safety analysis temporarily unavailable."
+        try:
+            clean_response = re.sub(r"```json|```", "", response).strip()
+            result = json.loads(clean_response)
+            if not isinstance(result, list):
+                raise ValueError("Expected a JSON array")
+        except Exception:
+            return [fallback] * len(items)
+
+        reasonings = [str(r) for r in result[:len(items)]]
+        reasonings.extend([fallback] * (len(items) - len(reasonings)))
+        return reasonings
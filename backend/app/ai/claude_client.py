@@ -1,4 +1,3 @@
-import os
 import json
 from typing import Dict, Any, List, Optional, Literal
 from datetime import datetime
@@ -6,6 +5,8 @@ import anthropic
 from anthropic import Anthropic, APIError, APIConnectionError, RateLimitError
 import time
 
+from app.core.config import get_settings
+
 
 class ClaudeClient:
     def __init__(
@@ -15,7 +16,7 @@ class ClaudeClient:
         max_tokens: int = 2000,
         temperature: float = 0.7
     ):
-        self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.api_key = api_key or get_settings().secrets.ANTHROPIC_API_KEY.get_secret_value()
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment")
         
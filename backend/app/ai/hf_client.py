@@ -37,10 +37,11 @@ Author: Safety Route Team
 Date: January 2026
 """
 
-import os
 import requests
 from typing import List, Dict, Optional
 
+from app.core.config import get_settings
+
 
 # ============================================================================
 # CONFIGURATION
@@ -50,10 +51,10 @@ from typing import List, Dict, Optional
 # facebook/bart-large-mnli is a pre-trained model that works well for general classification
 HF_API_URL = "https://api-inference.huggingface.co/models/facebook/bart-large-mnli"
 
-# Read API token from environment variable
+# Read API token from the shared settings (environment, then .env)
 # Get your free token at: https://huggingface.co/settings/tokens
 # Set it in your .env file as: HF_API_TOKEN=hf_xxxxxxxxxxxxx
-HF_API_TOKEN = os.getenv("HF_API_TOKEN", "")
+HF_API_TOKEN = get_settings().secrets.HF_API_TOKEN.get_secret_value()
 
 
 # ============================================================================
@@ -3,7 +3,7 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+client = OpenAI(api_key=settings.secrets.OPENAI_API_KEY.get_secret_value())
 
 
 def call_llm(prompt: str, model: str = "gpt-4", max_tokens: int = 500) -> str:
@@ -3,9 +3,16 @@ app/api/deps.py
 Shared FastAPI dependency functions for Safety Route backend.
 """
 
+import threading
 import uuid
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Type, TypeVar
+
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 def get_request_id() -> str:
@@ -13,7 +20,7 @@ def get_request_id() -> str:
 
 
 def get_current_timestamp() -> str:
-    return datetime.utcnow().isoformat() + "Z"
+    return datetime.now(timezone.utc).isoformat()
 
 
 def get_db():
@@ -24,4 +31,52 @@ def get_db():
 def get_user_id(user_id: Optional[str] = None) -> str:
     if user_id:
         return user_id
-    return f"user_{uuid.uuid4().hex[:8]}"
\ No newline at end of file
+    return f"user_{uuid.uuid4().hex[:8]}"
+
+
+def concurrency_limiter(max_inflight: int) -> Callable[[], Iterator[None]]:
+    """
+    Build a dependency that allows at most max_inflight concurrent requests.
+    Excess requests fail fast with 429 instead of queueing on the threadpool.
+    """
+    slots = threading.BoundedSemaphore(max_inflight)
+
+    def limit() -> Iterator[None]:
+        if not slots.acquire(blocking=False):
+            raise HTTPException(status_code=429, detail="Too many requests in flight, retry shortly")
+        try:
+            yield
+        finally:
+            slots.release()
+
+    return limit
+
+
+def validated_body(model: Type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """
+    Build a dependency that parses and validates the raw JSON body in a single
+    pydantic-core pass, using a TypeAdapter compiled once per model.
+    Errors are reported as the usual 422 validation response.
+    """
+    adapter = TypeAdapter(model)
+
+    async def parse(request: Request) -> ModelT:
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as exc:
+            raise RequestValidationError([
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ])
+
+    return parse
+
+
+def body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """openapi_extra documenting a body read through validated_body."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
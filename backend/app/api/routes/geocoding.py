@@ -6,6 +6,9 @@ from app.services.geocoding_service import geocoding_service
 
 router = APIRouter(prefix="/geocoding", tags=["Geocoding"])
 
+# Handlers are sync so FastAPI runs the blocking Nominatim calls on its
+# threadpool instead of stalling the event loop
+
 
 class GeocodeRequest(BaseModel):
     address: str
@@ -30,7 +33,7 @@ class PlaceSearchResponse(BaseModel):
 
 
 @router.post("/geocode", response_model=GeocodeResponse)
-async def geocode(request: GeocodeRequest):
+def geocode(request: GeocodeRequest):
     """
     Convert address to coordinates.
     """
@@ -48,7 +51,7 @@ async def geocode(request: GeocodeRequest):
 
 
 @router.get("/reverse", response_model=ReverseGeocodeResponse)
-async def reverse_geocode(
+def reverse_geocode(
     lat: float = Query(..., description="Latitude"),
     lon: float = Query(..., description="Longitude")
 ):
@@ -68,7 +71,7 @@ async def reverse_geocode(
 
 
 @router.get("/search", response_model=PlaceSearchResponse)
-async def search_places(
+def search_places(
     query: str = Query(..., min_length=2, description="Search query"),
     limit: int = Query(5, ge=1, le=20)
 ):
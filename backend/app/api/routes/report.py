@@ -39,7 +39,8 @@ async def get_nearby_reports(
     radius_km: float = Query(1.0, description="Search radius in kilometers"),
     hours_ago: int = Query(24, ge=1, le=168, description="Only reports from last N hours")
 ):
-    cutoff_time = datetime.utcnow() - timedelta(hours=hours_ago)
+    now = datetime.utcnow()  # one clock read per request, shared by every report
+    cutoff_time = now - timedelta(hours=hours_ago)
     nearby = []
     
     for report in reports_storage:
@@ -54,7 +55,7 @@ async def get_nearby_reports(
         )
         
         if distance <= radius_km:
-            report_age_hours = (datetime.utcnow() - report_time).total_seconds() / 3600
+            report_age_hours = (now - report_time).total_seconds() / 3600
             decay_weight = calculate_report_weight(report_age_hours, max_age_hours=hours_ago)
             
             nearby.append({
@@ -1,6 +1,9 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from typing import List, Optional
 from datetime import datetime
+import hashlib
+
+from cachetools import TTLCache
 
 from app.schemas.route import (
     RouteRequest,
@@ -10,21 +13,96 @@ from app.schemas.route import (
     AlternativeRoutesRequest
 )
 from app.services.maps_service import MapsService
-from app.services.safety_score_service import SafetyScoreService
+from app.services.safety_score_service import safety_score_service
 from app.agents.route_generator_agent import RouteGeneratorAgent
 from app.agents.safety_reasoning_agent import SafetyReasoningAgent
-from app.utils.response_utils import success_response, error_response
+from app.utils.response_utils import ORJSONResponse, success_response, error_response
 
 router = APIRouter()
 
 # Initialize services
 maps_service = MapsService()
-safety_service = SafetyScoreService()
+safety_service = safety_score_service
 route_agent = RouteGeneratorAgent()
 safety_agent = SafetyReasoningAgent()
 
+# Route analyses keyed by route_id; polling clients revalidate via ETag
+ANALYSIS_CACHE_TTL_SECONDS = 300
+analysis_cache: TTLCache = TTLCache(maxsize=10_000, ttl=ANALYSIS_CACHE_TTL_SECONDS)
+
+
+async def _plan_core(
+    source: dict,
+    destination: dict,
+    mode: Optional[str],
+    time_of_day: Optional[int],
+    user_profile: Optional[dict] = None
+) -> List[RouteOption]:
+    """
+    Fetch and score routes between two points.
+    
+    Shared by /plan and /safest so the latter can pass its already
+    validated query values straight through without building a
+    RouteRequest. The safest option is marked with is_safest.
+    """
+    # Get multiple routes from maps service
+    routes = await maps_service.get_routes(
+        source=source,
+        destination=destination,
+        mode=mode or "walking"
+    )
+    
+    if not routes:
+        raise HTTPException(
+            status_code=404,
+            detail="No routes found between source and destination"
+        )
+    
+    # Score every route and collect its unsafe zones first
+    time_of_day = time_of_day or datetime.now().hour
+    scored = []
+    for route in routes:
+        safety_score = await safety_service.calculate_safety_score(
+            route=route,
+            time_of_day=time_of_day,
+            user_profile=user_profile
+        )
+        unsafe_zones = await safety_service.get_unsafe_zones(route)
+        scored.append((route, safety_score, unsafe_zones))
+    
+    # One LLM call explains all routes instead of one call per route
+    reasonings = await safety_agent.analyze_routes_batch(scored)
+    
+    route_options = []
+    for idx, ((route, safety_score, unsafe_zones), reasoning) in enumerate(zip(scored, reasonings)):
+        route_option = RouteOption(
+            route_id=f"route_{idx + 1}",
+            summary=route.get("summary", f"Route {idx + 1}"),
+            distance=route.get("distance", 0),
+            duration=route.get("duration", 0),
+            polyline=route.get("polyline", ""),
+            safety_score=safety_score["overall_score"],
+            safety_details=SafetyDetails(
+                crime_score=safety_score["crime_score"],
+                lighting_score=safety_score["lighting_score"],
+                crowd_score=safety_score["crowd_score"],
+                time_factor=safety_score["time_factor"],
+                unsafe_zones=unsafe_zones,
+                reasoning=reasoning
+            ),
+            is_safest=False  # Will be set after comparing all routes
+        )
+        route_options.append(route_option)
+    
+    # Mark the safest route
+    if route_options:
+        safest = max(route_options, key=lambda r: r.safety_score)
+        safest.is_safest = True
+    
+    return route_options
+
 
-@router.post("/plan", response_model=dict)
+@router.post("/plan", response_model=dict, response_class=ORJSONResponse)
 async def plan_route(request: RouteRequest):
     """
     Plan routes from source to destination with safety scoring.
@@ -32,71 +110,22 @@ async def plan_route(request: RouteRequest):
     Returns multiple route options with safety scores.
     """
     try:
-        # Convert Pydantic models to dicts
-        source_dict = request.source.dict()
-        dest_dict = request.destination.dict()
-        
-        # Get multiple routes from maps service
-        routes = await maps_service.get_routes(
-            source=source_dict,
-            destination=dest_dict,
-            mode=request.mode or "walking"
+        route_options = await _plan_core(
+            source=request.source.dict(),
+            destination=request.destination.dict(),
+            mode=request.mode,
+            time_of_day=request.time_of_day,
+            user_profile=request.user_profile.dict() if request.user_profile else None
         )
         
-        if not routes:
-            raise HTTPException(
-                status_code=404,
-                detail="No routes found between source and destination"
-            )
-        
-        # Calculate safety score for each route
-        route_options = []
-        for idx, route in enumerate(routes):
-            # Calculate safety score
-            safety_score = await safety_service.calculate_safety_score(
-                route=route,
-                time_of_day=request.time_of_day or datetime.now().hour,
-                user_profile=request.user_profile.dict() if request.user_profile else None
-            )
-            
-            # Get unsafe zones along route
-            unsafe_zones = await safety_service.get_unsafe_zones(route)
-            
-            # Get AI reasoning for safety score
-            reasoning = await safety_agent.analyze_route_safety(
-                route=route,
-                safety_score=safety_score,
-                unsafe_zones=unsafe_zones
-            )
-            
-            route_option = RouteOption(
-                route_id=f"route_{idx + 1}",
-                summary=route.get("summary", f"Route {idx + 1}"),
-                distance=route.get("distance", 0),
-                duration=route.get("duration", 0),
-                polyline=route.get("polyline", ""),
-                safety_score=safety_score["overall_score"],
-                safety_details=SafetyDetails(
-                    crime_score=safety_score["crime_score"],
-                    lighting_score=safety_score["lighting_score"],
-                    crowd_score=safety_score["crowd_score"],
-                    time_factor=safety_score["time_factor"],
-                    unsafe_zones=unsafe_zones,
-                    reasoning=reasoning
-                ),
-                is_safest=False  # Will be set after comparing all routes
-            )
-            route_options.append(route_option)
-        
-        # Mark the safest route
-        if route_options:
-            safest = max(route_options, key=lambda r: r.safety_score)
-            safest.is_safest = True
+        safest_route_id = next(
+            (r.route_id for r in route_options if r.is_safest), None
+        )
         
         return success_response(
             data={
                 "routes": [r.dict() for r in route_options],
-                "safest_route_id": safest.route_id if route_options else None,
+                "safest_route_id": safest_route_id,
                 "timestamp": datetime.now().isoformat()
             },
             message=f"Found {len(route_options)} route(s)"
@@ -122,27 +151,20 @@ async def get_safest_route(
     Get only the safest route between two points.
     """
     try:
-        from app.schemas.route import Location
-        
-        request = RouteRequest(
-            source=Location(lat=source_lat, lng=source_lng),
-            destination=Location(lat=dest_lat, lng=dest_lng),
+        route_options = await _plan_core(
+            source={"lat": source_lat, "lng": source_lng, "address": None},
+            destination={"lat": dest_lat, "lng": dest_lng, "address": None},
             mode=mode,
             time_of_day=time_of_day
         )
         
-        # Use the route planning endpoint
-        result = await plan_route(request)
+        safest = next((r for r in route_options if r.is_safest), None)
         
-        if result.get("success") and result.get("data"):
-            routes = result["data"]["routes"]
-            safest = next((r for r in routes if r.get("is_safest")), None)
-            
-            if safest:
-                return success_response(
-                    data=safest,
-                    message="Safest route retrieved successfully"
-                )
+        if safest:
+            return success_response(
+                data=safest.dict(),
+                message="Safest route retrieved successfully"
+            )
         
         raise HTTPException(status_code=404, detail="No safe route found")
         
@@ -153,7 +175,7 @@ async def get_safest_route(
         )
 
 
-@router.post("/alternatives", response_model=dict)
+@router.post("/alternatives", response_model=dict, response_class=ORJSONResponse)
 async def get_alternative_routes(request: AlternativeRoutesRequest):
     """
     Get alternative routes excluding specific route IDs or unsafe zones.
@@ -172,19 +194,28 @@ async def get_alternative_routes(request: AlternativeRoutesRequest):
             max_routes=5
         )
         
-        # Filter and score
+        # Drop excluded routes before doing any scoring work
+        excluded = set(request.exclude_route_ids or ())
+        candidates = [
+            (f"route_{idx + 1}", route)
+            for idx, route in enumerate(routes)
+            if f"route_{idx + 1}" not in excluded
+        ]
+        
+        if not candidates:
+            return success_response(
+                data={"alternatives": [], "count": 0},
+                message="Found 0 alternative route(s)"
+            )
+        
+        # Score survivors; unsafe zones only for those above the threshold
+        time_of_day = request.time_of_day or datetime.now().hour
         alternative_options = []
-        for idx, route in enumerate(routes):
-            route_id = f"route_{idx + 1}"
-            
-            # Skip excluded routes
-            if request.exclude_route_ids and route_id in request.exclude_route_ids:
-                continue
-            
+        for route_id, route in candidates:
             # Calculate safety
             safety_score = await safety_service.calculate_safety_score(
                 route=route,
-                time_of_day=request.time_of_day or datetime.now().hour
+                time_of_day=time_of_day
             )
             
             # Skip routes below minimum safety threshold
@@ -226,29 +257,30 @@ async def get_alternative_routes(request: AlternativeRoutesRequest):
 
 
 @router.get("/analyze/{route_id}", response_model=dict)
-async def analyze_route(route_id: str):
+async def analyze_route(route_id: str, request: Request, response: Response):
     """
     Deep analysis of a specific route including all safety factors.
+    
+    Results are cached per route_id; clients sending a matching
+    If-None-Match header get a 304 without any recomputation.
     """
+    etag = f'"{hashlib.blake2b(route_id.encode(), digest_size=8).hexdigest()}"'
+    cache_control = f"max-age={ANALYSIS_CACHE_TTL_SECONDS}"
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": cache_control}
+        )
+    
     try:
-        # In real implementation, fetch route from cache/database
-        # For now, return mock analysis
+        analysis = analysis_cache.get(route_id)
+        if analysis is None:
+            analysis = _build_route_analysis(route_id)
+            analysis_cache[route_id] = analysis
         
-        analysis = {
-            "route_id": route_id,
-            "detailed_analysis": {
-                "crime_analysis": "Low crime area with 2 police stations nearby",
-                "lighting_analysis": "Well-lit for 80% of the route",
-                "crowd_analysis": "Moderate foot traffic expected",
-                "time_recommendations": {
-                    "safe_hours": "6 AM - 9 PM",
-                    "caution_hours": "9 PM - 11 PM",
-                    "avoid_hours": "11 PM - 6 AM"
-                }
-            },
-            "risk_segments": [],
-            "safe_stops": ["Police Station - 0.5km", "Hospital - 1.2km"]
-        }
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = cache_control
         
         return success_response(
             data=analysis,
@@ -262,6 +294,27 @@ async def analyze_route(route_id: str):
         )
 
 
+def _build_route_analysis(route_id: str) -> dict:
+    """Build the analysis payload for a route."""
+    # In real implementation, fetch route from cache/database
+    # For now, return mock analysis
+    return {
+        "route_id": route_id,
+        "detailed_analysis": {
+            "crime_analysis": "Low crime area with 2 police stations nearby",
+            "lighting_analysis": "Well-lit for 80% of the route",
+            "crowd_analysis": "Moderate foot traffic expected",
+            "time_recommendations": {
+                "safe_hours": "6 AM - 9 PM",
+                "caution_hours": "9 PM - 11 PM",
+                "avoid_hours": "11 PM - 6 AM"
+            }
+        },
+        "risk_segments": [],
+        "safe_stops": ["Police Station - 0.5km", "Hospital - 1.2km"]
+    }
+
+
 @router.post("/validate", response_model=dict)
 async def validate_route(
     polyline: str,
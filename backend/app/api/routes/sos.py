@@ -1,12 +1,66 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
+from collections import deque
 from datetime import datetime
+from itertools import islice
+from typing import Optional
+import asyncio
+import contextlib
 import uuid
 
+from app.core.database import get_db
 from app.schemas.sos import SOSRequest, SOSResponse
 
 router = APIRouter(prefix="/sos", tags=["emergency"])
 
-sos_alerts_storage = []
+SOS_HISTORY_MAX_ALERTS = 50_000
+
+# Most recent alerts only; older ones remain in the persisted store
+sos_alerts_storage: deque = deque(maxlen=SOS_HISTORY_MAX_ALERTS)
+
+_persist_queue: Optional[asyncio.Queue] = None
+_persist_task: Optional[asyncio.Task] = None
+
+
+async def _persist_alerts(queue: asyncio.Queue) -> None:
+    """Drain queued alerts into the emergencies collection."""
+    emergencies = get_db()["emergencies"]
+    while True:
+        alert = await queue.get()
+        emergencies[alert["sos_id"]] = alert
+        queue.task_done()
+
+
+async def start_persistence() -> None:
+    """Start the background alert writer on the running loop (app startup)."""
+    global _persist_queue, _persist_task
+    _persist_queue = asyncio.Queue()
+    _persist_task = asyncio.create_task(_persist_alerts(_persist_queue))
+
+
+async def stop_persistence() -> None:
+    """Write out every queued alert, then stop the writer (app shutdown)."""
+    global _persist_queue, _persist_task
+    queue, task = _persist_queue, _persist_task
+    # Later alerts are written inline while the writer drains
+    _persist_queue = _persist_task = None
+    if queue is None or task is None:
+        return
+    if not task.done():
+        await queue.join()
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+def _enqueue_for_persistence(alert_data: dict) -> None:
+    """
+    Hand an alert to the background writer. Without one (the app's lifespan
+    did not run), the alert is written inline so it is never dropped.
+    """
+    if _persist_queue is None:
+        get_db()["emergencies"][alert_data["sos_id"]] = alert_data
+        return
+    _persist_queue.put_nowait(alert_data)
 
 
 @router.post("", response_model=SOSResponse)
@@ -25,6 +79,7 @@ async def trigger_sos(request: SOSRequest):
     }
     
     sos_alerts_storage.append(alert_data)
+    _enqueue_for_persistence(alert_data)
     
     simulated_contacts = ", ".join(request.emergency_contacts) if request.emergency_contacts else "default emergency services"
     
@@ -39,8 +94,13 @@ async def trigger_sos(request: SOSRequest):
 
 
 @router.get("/history")
-async def get_sos_history():
+async def get_sos_history(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum alerts to return"),
+    offset: int = Query(0, ge=0, description="Number of alerts to skip")
+):
     return {
         "total_alerts": len(sos_alerts_storage),
-        "alerts": sos_alerts_storage
+        "limit": limit,
+        "offset": offset,
+        "alerts": list(islice(sos_alerts_storage, offset, offset + limit))
     }
\ No newline at end of file
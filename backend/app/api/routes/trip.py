@@ -20,6 +20,7 @@ Trip tracking allows the application to:
 
 Data Storage:
 - Trips are stored in-memory (not persisted to database)
+- Trips expire 24 hours after they start, so memory stays bounded
 - Suitable for demo/hackathon purposes
 - In production, would use database storage
 
@@ -27,23 +28,103 @@ Author: Safety Route Team
 Date: January 2026
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import Dict, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import BaseModel, ConfigDict, Field
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set, Tuple
 from datetime import datetime
-import uuid
+from operator import attrgetter
+from secrets import token_hex
+import hashlib
+import threading
+import time
 
-from app.utils.response_utils import success_response, error_response
+from cachetools import TTLCache
 
+from app.api.deps import concurrency_limiter
+from app.utils.response_utils import ORJSONResponse, success_response
 
-router = APIRouter(prefix="/trip", tags=["Trip Management"])
 
+router = APIRouter(
+    prefix="/trip",
+    tags=["Trip Management"],
+    default_response_class=ORJSONResponse
+)
+
+
+# Most recent location updates kept per trip; older points are dropped
+MAX_LOCATION_UPDATES_PER_TRIP = 256
+
+
+@dataclass(slots=True)
+class Trip:
+    """
+    In-memory trip record. Coordinates are (lat, lng) tuples; location
+    updates are (lat, lng, unix_ts) tuples.
+    """
+    trip_id: str
+    user_id: str
+    source: str
+    destination: str
+    source_coordinates: Optional[Tuple[float, float]]
+    destination_coordinates: Optional[Tuple[float, float]]
+    started_at: str
+    started_ts: float
+    ended_at: Optional[str] = None
+    status: str = "active"
+    current_location: Optional[Tuple[float, float, float]] = None
+    location_updates: deque = field(
+        default_factory=lambda: deque(maxlen=MAX_LOCATION_UPDATES_PER_TRIP)
+    )
+    total_updates: int = 0
+    duration_minutes: int = 0
+    end_coordinates: Optional[Tuple[float, float]] = None
+
+
+# Trips, active or completed, are dropped a day after they start
+TRIP_TTL_SECONDS = 86_400
+MAX_STORED_TRIPS = 10_000
+
+trips_db: TTLCache = TTLCache(maxsize=MAX_STORED_TRIPS, ttl=TRIP_TTL_SECONDS)
+
+# Cap on concurrent start/update-location requests per worker
+MAX_INFLIGHT_TRIP_WRITES = 100
+limit_trip_writes = concurrency_limiter(MAX_INFLIGHT_TRIP_WRITES)
+
+# Fields of a stored trip returned by each endpoint
+START_RESPONSE_KEYS = ("trip_id", "user_id", "source", "destination", "started_at", "status")
+STATUS_RESPONSE_KEYS = (
+    "trip_id", "user_id", "status", "source", "destination",
+    "started_at", "ended_at"
+)
+ACTIVE_TRIP_KEYS = ("trip_id", "source", "destination", "started_at")
+
+# Attribute getters for those keys, built once so a view is a single C call
+_start_fields = attrgetter(*START_RESPONSE_KEYS)
+_status_fields = attrgetter(*STATUS_RESPONSE_KEYS)
+_active_fields = attrgetter(*ACTIVE_TRIP_KEYS)
+
+# user_id -> ids of that user's active trips, kept in step with trips_db
+active_by_user: Dict[str, Set[str]] = defaultdict(set)
 
-trips_db: Dict[str, Dict] = {}
+# Handlers are sync and run on the threadpool; guards trips_db (TTLCache
+# is not thread-safe) and active_by_user
+_trips_lock = threading.Lock()
+
+
+def _location_payload(location: Optional[Tuple[float, float, float]]) -> Optional[Dict]:
+    """Expand a stored (lat, lng, unix_ts) tuple into its response shape."""
+    if location is None:
+        return None
+    lat, lng, ts = location
+    return {"lat": lat, "lng": lng, "timestamp": datetime.fromtimestamp(ts).isoformat()}
 
 
 class TripStartRequest(BaseModel):
     """Request model for starting a new trip"""
+    model_config = ConfigDict(strict=True, extra="forbid")
+    
     user_id: str = Field(..., description="Unique identifier for the user")
     source: str = Field(..., description="Starting location description")
     destination: str = Field(..., description="Destination location description")
@@ -55,6 +136,8 @@ class TripStartRequest(BaseModel):
 
 class TripEndRequest(BaseModel):
     """Request model for ending a trip"""
+    model_config = ConfigDict(strict=True, extra="forbid")
+    
     trip_id: str = Field(..., description="Unique trip identifier")
     end_lat: Optional[float] = Field(None, ge=-90, le=90, description="Final latitude")
     end_lng: Optional[float] = Field(None, ge=-180, le=180, description="Final longitude")
@@ -62,6 +145,8 @@ class TripEndRequest(BaseModel):
 
 class TripUpdateRequest(BaseModel):
     """Request model for updating trip location"""
+    model_config = ConfigDict(strict=True, extra="forbid")
+    
     trip_id: str = Field(..., description="Unique trip identifier")
     current_lat: float = Field(..., ge=-90, le=90, description="Current latitude")
     current_lng: float = Field(..., ge=-180, le=180, description="Current longitude")
@@ -70,10 +155,11 @@ class TripUpdateRequest(BaseModel):
 @router.post(
     "/start",
     response_model=Dict,
+    dependencies=[Depends(limit_trip_writes)],
     summary="Start a New Trip",
     description="Initialize a new navigation trip session with source and destination"
 )
-async def start_trip(request: TripStartRequest):
+def start_trip(request: TripStartRequest):
     """
     Start a new trip and receive a unique trip ID for tracking.
     
@@ -119,50 +205,37 @@ async def start_trip(request: TripStartRequest):
             "message": "Trip started successfully"
         }
     """
-    try:
-        trip_id = f"trip_{uuid.uuid4().hex[:12]}"
-        
-        start_time = datetime.now()
-        
-        trip_data = {
-            "trip_id": trip_id,
-            "user_id": request.user_id,
-            "source": request.source,
-            "destination": request.destination,
-            "source_coordinates": {
-                "lat": request.source_lat,
-                "lng": request.source_lng
-            } if request.source_lat and request.source_lng else None,
-            "destination_coordinates": {
-                "lat": request.dest_lat,
-                "lng": request.dest_lng
-            } if request.dest_lat and request.dest_lng else None,
-            "started_at": start_time.isoformat(),
-            "ended_at": None,
-            "status": "active",
-            "current_location": None,
-            "location_updates": []
-        }
-        
-        trips_db[trip_id] = trip_data
-        
-        return success_response(
-            data={
-                "trip_id": trip_id,
-                "user_id": request.user_id,
-                "source": request.source,
-                "destination": request.destination,
-                "started_at": start_time.isoformat(),
-                "status": "active"
-            },
-            message="Trip started successfully"
-        )
+    trip_id = f"trip_{token_hex(6)}"
+    
+    start_ts = time.time()
+    started_at = datetime.fromtimestamp(start_ts).isoformat()
+    
+    trip = Trip(
+        trip_id=trip_id,
+        user_id=request.user_id,
+        source=request.source,
+        destination=request.destination,
+        source_coordinates=(
+            (request.source_lat, request.source_lng)
+            if request.source_lat and request.source_lng else None
+        ),
+        destination_coordinates=(
+            (request.dest_lat, request.dest_lng)
+            if request.dest_lat and request.dest_lng else None
+        ),
+        started_at=started_at,
+        started_ts=start_ts
+    )
     
-    except Exception as e:
-        return error_response(
-            message=f"Failed to start trip: {str(e)}",
-            status_code=500
-        )
+    with _trips_lock:
+        trips_db[trip_id] = trip
+        active_by_user[request.user_id].add(trip_id)
+    
+    return success_response(
+        data=dict(zip(START_RESPONSE_KEYS, _start_fields(trip))),
+        message="Trip started successfully"
+    )
+
 
 
 @router.post(
@@ -171,13 +244,13 @@ async def start_trip(request: TripStartRequest):
     summary="End an Active Trip",
     description="Mark a trip as completed and calculate trip statistics"
 )
-async def end_trip(request: TripEndRequest):
+def end_trip(request: TripEndRequest):
     """
     End an active trip and get trip summary.
     
     This endpoint marks the trip as completed, calculates duration,
     and returns trip statistics. The trip data remains in memory
-    for potential history/analytics queries.
+    until it expires, for potential history/analytics queries.
     
     Request Body:
         trip_id: The unique trip identifier from start_trip
@@ -210,69 +283,66 @@ async def end_trip(request: TripEndRequest):
             "message": "Trip ended successfully. Duration: 25 minutes"
         }
     """
-    try:
-        trip_id = request.trip_id
-        
-        if trip_id not in trips_db:
+    trip_id = request.trip_id
+    
+    # Check and complete the trip in one step, so concurrent ends of the
+    # same trip cannot both pass the status check
+    with _trips_lock:
+        trip = trips_db.get(trip_id)
+        if trip is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Trip {trip_id} not found"
             )
         
-        trip = trips_db[trip_id]
-        
-        if trip["status"] == "completed":
+        if trip.status == "completed":
             raise HTTPException(
                 status_code=400,
                 detail=f"Trip {trip_id} is already completed"
             )
         
-        end_time = datetime.now()
-        start_time = datetime.fromisoformat(trip["started_at"])
+        end_ts = time.time()
+        ended_at = datetime.fromtimestamp(end_ts).isoformat()
         
-        duration_seconds = (end_time - start_time).total_seconds()
+        duration_seconds = end_ts - trip.started_ts
         duration_minutes = int(duration_seconds / 60)
         
-        trip["ended_at"] = end_time.isoformat()
-        trip["status"] = "completed"
-        trip["duration_minutes"] = duration_minutes
+        trip.ended_at = ended_at
+        trip.status = "completed"
+        trip.duration_minutes = duration_minutes
         
         if request.end_lat and request.end_lng:
-            trip["end_coordinates"] = {
-                "lat": request.end_lat,
-                "lng": request.end_lng
-            }
+            trip.end_coordinates = (request.end_lat, request.end_lng)
         
-        return success_response(
-            data={
-                "trip_id": trip_id,
-                "duration_minutes": duration_minutes,
-                "started_at": trip["started_at"],
-                "ended_at": end_time.isoformat(),
-                "status": "completed",
-                "source": trip["source"],
-                "destination": trip["destination"]
-            },
-            message=f"Trip ended successfully. Duration: {duration_minutes} minutes"
-        )
-    
-    except HTTPException:
-        raise
+        user_active = active_by_user.get(trip.user_id)
+        if user_active is not None:
+            user_active.discard(trip_id)
+            if not user_active:
+                del active_by_user[trip.user_id]
     
-    except Exception as e:
-        return error_response(
-            message=f"Failed to end trip: {str(e)}",
-            status_code=500
-        )
+    return success_response(
+        data={
+            "trip_id": trip_id,
+            "duration_minutes": duration_minutes,
+            "started_at": trip.started_at,
+            "ended_at": ended_at,
+            "status": "completed",
+            "source": trip.source,
+            "destination": trip.destination
+        },
+        message=f"Trip ended successfully. Duration: {duration_minutes} minutes"
+    )
+
 
 
 @router.post(
     "/update-location",
     response_model=Dict,
+    dependencies=[Depends(limit_trip_writes)],
     summary="Update Current Trip Location",
     description="Update the current location during an active trip for real-time tracking"
 )
-async def update_trip_location(request: TripUpdateRequest):
+def update_trip_location(request: TripUpdateRequest):
     """
     Update current location during an active trip.
     
@@ -311,53 +381,45 @@ async def update_trip_location(request: TripUpdateRequest):
             "message": "Location updated successfully"
         }
     """
-    try:
-        trip_id = request.trip_id
-        
-        if trip_id not in trips_db:
+    trip_id = request.trip_id
+    
+    # Check and update under the lock, so concurrent updates (or an end
+    # racing an update) cannot interleave their writes
+    with _trips_lock:
+        trip = trips_db.get(trip_id)
+        if trip is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Trip {trip_id} not found"
             )
         
-        trip = trips_db[trip_id]
-        
-        if trip["status"] != "active":
+        if trip.status != "active":
             raise HTTPException(
                 status_code=400,
-                detail=f"Trip {trip_id} is not active (status: {trip['status']})"
+                detail=f"Trip {trip_id} is not active (status: {trip.status})"
             )
         
-        current_location = {
-            "lat": request.current_lat,
-            "lng": request.current_lng,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        trip["current_location"] = current_location
-        trip["location_updates"].append(current_location)
+        updated_ts = time.time()
+        current_location = (request.current_lat, request.current_lng, updated_ts)
         
-        return success_response(
-            data={
-                "trip_id": trip_id,
-                "current_location": {
-                    "lat": request.current_lat,
-                    "lng": request.current_lng
-                },
-                "updated_at": current_location["timestamp"],
-                "total_updates": len(trip["location_updates"])
-            },
-            message="Location updated successfully"
-        )
-    
-    except HTTPException:
-        raise
+        trip.current_location = current_location
+        trip.location_updates.append(current_location)
+        trip.total_updates += 1
+        total_updates = trip.total_updates
     
-    except Exception as e:
-        return error_response(
-            message=f"Failed to update location: {str(e)}",
-            status_code=500
-        )
+    return success_response(
+        data={
+            "trip_id": trip_id,
+            "current_location": {
+                "lat": request.current_lat,
+                "lng": request.current_lng
+            },
+            "updated_at": datetime.fromtimestamp(updated_ts).isoformat(),
+            "total_updates": total_updates
+        },
+        message="Location updated successfully"
+    )
+
 
 
 @router.get(
@@ -366,7 +428,7 @@ async def update_trip_location(request: TripUpdateRequest):
     summary="Get Trip Status",
     description="Retrieve current status and details of a trip"
 )
-async def get_trip_status(trip_id: str):
+def get_trip_status(trip_id: str, request: Request, response: Response):
     """
     Get the current status and details of a trip.
     
@@ -378,6 +440,7 @@ async def get_trip_status(trip_id: str):
     
     Returns:
         200: Trip details
+        304: Completed trip unchanged since the ETag in If-None-Match
         404: Trip not found
         500: Server error
     
@@ -399,48 +462,39 @@ async def get_trip_status(trip_id: str):
             }
         }
     """
-    try:
-        if trip_id not in trips_db:
+    # Read a consistent snapshot; end and update-location write under the lock
+    with _trips_lock:
+        trip = trips_db.get(trip_id)
+        if trip is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Trip {trip_id} not found"
             )
         
-        trip = trips_db[trip_id]
-        
-        response_data = {
-            "trip_id": trip["trip_id"],
-            "user_id": trip["user_id"],
-            "status": trip["status"],
-            "source": trip["source"],
-            "destination": trip["destination"],
-            "started_at": trip["started_at"],
-            "ended_at": trip.get("ended_at"),
-            "current_location": trip.get("current_location"),
-            "total_location_updates": len(trip["location_updates"])
-        }
-        
-        if trip["status"] == "active":
-            start_time = datetime.fromisoformat(trip["started_at"])
-            current_time = datetime.now()
-            duration_seconds = (current_time - start_time).total_seconds()
-            response_data["duration_so_far_minutes"] = int(duration_seconds / 60)
-        else:
-            response_data["duration_minutes"] = trip.get("duration_minutes", 0)
-        
-        return success_response(
-            data=response_data,
-            message="Trip details retrieved successfully"
-        )
+        response_data = dict(zip(STATUS_RESPONSE_KEYS, _status_fields(trip)))
+        response_data["current_location"] = _location_payload(trip.current_location)
+        response_data["total_location_updates"] = trip.total_updates
+        started_ts = trip.started_ts
+        duration_minutes = trip.duration_minutes
     
-    except HTTPException:
-        raise
+    # Completed trips never change, so pollers can revalidate for free
+    if response_data["status"] == "completed":
+        etag = f'"{hashlib.blake2b((trip_id + response_data["ended_at"]).encode(), digest_size=8).hexdigest()}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
     
-    except Exception as e:
-        return error_response(
-            message=f"Failed to get trip status: {str(e)}",
-            status_code=500
-        )
+    if response_data["status"] == "active":
+        duration_seconds = time.time() - started_ts
+        response_data["duration_so_far_minutes"] = int(duration_seconds / 60)
+    else:
+        response_data["duration_minutes"] = duration_minutes
+    
+    return success_response(
+        data=response_data,
+        message="Trip details retrieved successfully"
+    )
+
 
 
 @router.get(
@@ -449,7 +503,7 @@ async def get_trip_status(trip_id: str):
     summary="Get Active Trips for User",
     description="Retrieve all active trips for a specific user"
 )
-async def get_active_trips(user_id: str):
+def get_active_trips(user_id: str):
     """
     Get all active trips for a user.
     
@@ -483,30 +537,30 @@ async def get_active_trips(user_id: str):
             }
         }
     """
-    try:
-        active_trips = [
-            {
-                "trip_id": trip["trip_id"],
-                "source": trip["source"],
-                "destination": trip["destination"],
-                "started_at": trip["started_at"],
-                "current_location": trip.get("current_location")
-            }
-            for trip in trips_db.values()
-            if trip["user_id"] == user_id and trip["status"] == "active"
-        ]
+    active_trips = []
+    with _trips_lock:
+        active_trip_ids = active_by_user.get(user_id, set())
+        expired = set()
+        for tid in active_trip_ids:
+            trip = trips_db.get(tid)
+            if trip is None:
+                expired.add(tid)
+            else:
+                summary = dict(zip(ACTIVE_TRIP_KEYS, _active_fields(trip)))
+                summary["current_location"] = _location_payload(trip.current_location)
+                active_trips.append(summary)
         
-        return success_response(
-            data={
-                "user_id": user_id,
-                "active_trips": active_trips,
-                "count": len(active_trips)
-            },
-            message=f"Found {len(active_trips)} active trip(s)"
-        )
-    
-    except Exception as e:
-        return error_response(
-            message=f"Failed to get active trips: {str(e)}",
-            status_code=500
-        )
\ No newline at end of file
+        # Forget active trips that expired before being ended
+        if expired:
+            active_trip_ids -= expired
+            if not active_trip_ids:
+                del active_by_user[user_id]
+    
+    return success_response(
+        data={
+            "user_id": user_id,
+            "active_trips": active_trips,
+            "count": len(active_trips)
+        },
+        message=f"Found {len(active_trips)} active trip(s)"
+    )
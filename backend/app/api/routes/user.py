@@ -27,21 +27,196 @@ Author: Safety Route Team
 Date: January 2026
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field, validator
-from typing import Dict, Optional, List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, Tuple
+import sys
+import threading
 
-from app.utils.response_utils import success_response, error_response
+import orjson
 
+from app.api.deps import body_openapi, validated_body
+from app.utils.response_utils import ORJSONResponse, success_response
 
-router = APIRouter(prefix="/user", tags=["User Management"])
+
+router = APIRouter(
+    prefix="/user",
+    tags=["User Management"],
+    default_response_class=ORJSONResponse
+)
+
+
+@dataclass(slots=True)
+class Preferences:
+    """Safety preferences that shape route recommendations."""
+    avoid_high_crime: bool = True
+    prefer_well_lit: bool = True
+    prefer_crowded: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class EmergencyContact:
+    """Contact notified on SOS alerts."""
+    contact_name: str
+    phone_number: str
+    relationship: Optional[str] = None
 
 
-users_db: Dict[str, Dict] = {}
+@dataclass(slots=True)
+class User:
+    """In-memory user record; field order is the GET /user response order."""
+    user_id: str
+    name: str
+    preferred_travel_mode: str
+    night_travel: bool
+    phone: Optional[str]
+    preferences: Preferences = field(default_factory=Preferences)
+    # Immutable: adding a contact swaps in a new tuple
+    emergency_contacts: Tuple[EmergencyContact, ...] = ()
+    created_at: Optional[str] = None
+
+
+class UsersStore:
+    """
+    Read-mostly user map using read-copy-update.
+    
+    Readers use the current immutable snapshot and never take a lock.
+    Writers copy the snapshot (and the user they change) under a lock and
+    publish the new one with a single reference swap, so a reader always
+    sees a complete user.
+    
+    It also caches each user's rendered response views. A view is stored
+    under the lock only while its user is still the published one, and is
+    dropped with the user, so a delete never leaves a view behind.
+    
+    The store is per process. Running several workers needs a shared
+    backend behind get/add/update/pop and the rendered-view methods; the
+    handlers only use these methods.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Mapping[str, User] = MappingProxyType({})
+        self._rendered: Dict[str, "RenderedUser"] = {}
+    
+    def get(self, user_id: str) -> Optional[User]:
+        return self._snapshot.get(user_id)
+    
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._snapshot
+    
+    def add(self, user_id: str, user: User) -> bool:
+        """Insert a new user; returns False if the ID is already taken."""
+        with self._lock:
+            if user_id in self._snapshot:
+                return False
+            self._publish({**self._snapshot, user_id: user})
+            return True
+    
+    def update(self, user_id: str, mutate: Callable[[User], None]) -> Optional[User]:
+        """Apply mutate to a copy of the user and publish it; None if missing."""
+        with self._lock:
+            current = self._snapshot.get(user_id)
+            if current is None:
+                return None
+            user = replace(current, preferences=replace(current.preferences))
+            mutate(user)
+            self._publish({**self._snapshot, user_id: user})
+            return user
+    
+    def pop(self, user_id: str) -> Optional[User]:
+        """Remove and return a user; None if missing."""
+        with self._lock:
+            user = self._snapshot.get(user_id)
+            if user is None:
+                return None
+            users = dict(self._snapshot)
+            del users[user_id]
+            self._publish(users)
+            self._rendered.pop(user_id, None)
+            return user
+    
+    def get_rendered(self, user_id: str, user: User) -> Optional["RenderedUser"]:
+        """Cached views of this exact published user, if any."""
+        cached = self._rendered.get(user_id)
+        if cached is not None and cached.user is user:
+            return cached
+        return None
+    
+    def put_rendered(self, user_id: str, rendered: "RenderedUser") -> None:
+        """Cache views, unless their user has since been replaced or deleted."""
+        with self._lock:
+            if self._snapshot.get(user_id) is rendered.user:
+                self._rendered[user_id] = rendered
+    
+    def _publish(self, users: Dict[str, User]) -> None:
+        self._snapshot = MappingProxyType(users)
+
+
+users_db = UsersStore()
+
+
+@dataclass(slots=True, frozen=True)
+class RenderedUser:
+    """Response views of one published User, built once per write."""
+    user: User
+    public: Dict[str, object]
+    profile_body: bytes
+    contacts_body: bytes
+
+
+def _render_user(user_id: str, user: User) -> RenderedUser:
+    """
+    Response views for a user, rebuilt only after it changes. Store writes
+    publish a new User, so the store's identity check spots stale views.
+    """
+    cached = users_db.get_rendered(user_id, user)
+    if cached is not None:
+        return cached
+    
+    contacts = user.emergency_contacts
+    profile_body = orjson.dumps(success_response(
+        data=user,
+        message="User profile retrieved successfully"
+    ))
+    contacts_body = orjson.dumps(success_response(
+        data={
+            "user_id": user_id,
+            "emergency_contacts": contacts,
+            "count": len(contacts)
+        },
+        message=f"Retrieved {len(contacts)} emergency contact(s)"
+    ))
+    rendered = RenderedUser(
+        user=user,
+        public={
+            "user_id": user_id,
+            "name": user.name,
+            "preferred_travel_mode": user.preferred_travel_mode,
+            "night_travel": user.night_travel
+        },
+        profile_body=profile_body,
+        contacts_body=contacts_body
+    )
+    users_db.put_rendered(user_id, rendered)
+    return rendered
+
+
+TRAVEL_MODES = ("walking", "biking", "driving")
+ALLOWED_TRAVEL_MODES = frozenset(TRAVEL_MODES)
+_TRAVEL_MODE_ERROR = f"Travel mode must be one of: {', '.join(TRAVEL_MODES)}"
+
+# Error details are fixed strings: the user ID is already in the request path
+_USER_NOT_FOUND = "User not found"
+_USER_EXISTS = "User already exists"
 
 
 class UserCreateRequest(BaseModel):
     """Request model for creating a new user"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     user_id: str = Field(..., description="Unique user identifier")
     name: str = Field(..., min_length=1, max_length=100, description="User's full name")
     preferred_travel_mode: str = Field(
@@ -54,46 +229,59 @@ class UserCreateRequest(BaseModel):
     )
     phone: Optional[str] = Field(None, description="User's phone number")
     
-    @validator('preferred_travel_mode')
+    @field_validator('preferred_travel_mode')
+    @classmethod
     def validate_travel_mode(cls, v):
-        allowed_modes = ['walking', 'biking', 'driving']
-        if v.lower() not in allowed_modes:
-            raise ValueError(f"Travel mode must be one of: {', '.join(allowed_modes)}")
-        return v.lower()
+        mode = v.lower()
+        if mode not in ALLOWED_TRAVEL_MODES:
+            raise ValueError(_TRAVEL_MODE_ERROR)
+        return sys.intern(mode)
 
 
 class UserPreferencesUpdate(BaseModel):
     """Request model for updating user preferences"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     preferred_travel_mode: Optional[str] = Field(None, description="Travel mode")
     night_travel: Optional[bool] = Field(None, description="Night travel preference")
     avoid_high_crime: Optional[bool] = Field(None, description="Avoid high crime areas")
     prefer_well_lit: Optional[bool] = Field(None, description="Prefer well-lit routes")
     prefer_crowded: Optional[bool] = Field(None, description="Prefer crowded areas")
     
-    @validator('preferred_travel_mode')
+    @field_validator('preferred_travel_mode')
+    @classmethod
     def validate_travel_mode(cls, v):
         if v is not None:
-            allowed_modes = ['walking', 'biking', 'driving']
-            if v.lower() not in allowed_modes:
-                raise ValueError(f"Travel mode must be one of: {', '.join(allowed_modes)}")
-            return v.lower()
+            mode = v.lower()
+            if mode not in ALLOWED_TRAVEL_MODES:
+                raise ValueError(_TRAVEL_MODE_ERROR)
+            return sys.intern(mode)
         return v
 
 
 class EmergencyContactRequest(BaseModel):
     """Request model for adding emergency contact"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     contact_name: str = Field(..., min_length=1, max_length=100, description="Contact name")
     phone_number: str = Field(..., description="Contact phone number")
     relationship: Optional[str] = Field(None, description="Relationship to user")
 
 
+# Request bodies are parsed and validated straight from bytes by one
+# TypeAdapter per model, built here once
+parse_user_create = validated_body(UserCreateRequest)
+parse_preferences_update = validated_body(UserPreferencesUpdate)
+parse_emergency_contact = validated_body(EmergencyContactRequest)
+
+
 @router.post(
     "/create",
-    response_model=Dict,
     summary="Create New User Profile",
-    description="Register a new user with basic profile information and preferences"
+    description="Register a new user with basic profile information and preferences",
+    openapi_extra=body_openapi(UserCreateRequest)
 )
-async def create_user(request: UserCreateRequest):
+def create_user(request: UserCreateRequest = Depends(parse_user_create)):
     """
     Create a new user profile.
     
@@ -134,59 +322,36 @@ async def create_user(request: UserCreateRequest):
             "message": "User profile created successfully"
         }
     """
-    try:
-        user_id = request.user_id
-        
-        if user_id in users_db:
-            raise HTTPException(
-                status_code=400,
-                detail=f"User with ID '{user_id}' already exists"
-            )
-        
-        user_data = {
-            "user_id": user_id,
-            "name": request.name,
-            "preferred_travel_mode": request.preferred_travel_mode,
-            "night_travel": request.night_travel,
-            "phone": request.phone,
-            "preferences": {
-                "avoid_high_crime": True,
-                "prefer_well_lit": True,
-                "prefer_crowded": False
-            },
-            "emergency_contacts": [],
-            "created_at": None
-        }
-        
-        users_db[user_id] = user_data
-        
-        return success_response(
-            data={
-                "user_id": user_id,
-                "name": request.name,
-                "preferred_travel_mode": request.preferred_travel_mode,
-                "night_travel": request.night_travel
-            },
-            message="User profile created successfully"
-        )
-    
-    except HTTPException:
-        raise
+    # The ID is both the store key and a field; intern it so both share one string
+    user_id = sys.intern(request.user_id)
+    
+    user_data = User(
+        user_id=user_id,
+        name=request.name,
+        preferred_travel_mode=request.preferred_travel_mode,
+        night_travel=request.night_travel,
+        phone=request.phone
+    )
     
-    except Exception as e:
-        return error_response(
-            message=f"Failed to create user: {str(e)}",
-            status_code=500
+    if not users_db.add(user_id, user_data):
+        raise HTTPException(
+            status_code=400,
+            detail=_USER_EXISTS
         )
+    rendered = _render_user(user_id, user_data)
+    
+    return success_response(
+        data=rendered.public,
+        message="User profile created successfully"
+    )
 
 
 @router.get(
     "/{user_id}",
-    response_model=Dict,
     summary="Get User Profile",
     description="Retrieve complete user profile including preferences and emergency contacts"
 )
-async def get_user(user_id: str):
+def get_user(user_id: str):
     """
     Get user profile by user ID.
     
@@ -228,37 +393,26 @@ async def get_user(user_id: str):
             }
         }
     """
-    try:
-        if user_id not in users_db:
-            raise HTTPException(
-                status_code=404,
-                detail=f"User '{user_id}' not found"
-            )
-        
-        user_data = users_db[user_id]
-        
-        return success_response(
-            data=user_data,
-            message="User profile retrieved successfully"
+    user_data = users_db.get(user_id)
+    if user_data is None:
+        raise HTTPException(
+            status_code=404,
+            detail=_USER_NOT_FOUND
         )
     
-    except HTTPException:
-        raise
-    
-    except Exception as e:
-        return error_response(
-            message=f"Failed to retrieve user: {str(e)}",
-            status_code=500
-        )
+    return Response(content=_render_user(user_id, user_data).profile_body, media_type="application/json")
 
 
 @router.put(
     "/{user_id}/preferences",
-    response_model=Dict,
     summary="Update User Preferences",
-    description="Update safety and travel preferences for a user"
+    description="Update safety and travel preferences for a user",
+    openapi_extra=body_openapi(UserPreferencesUpdate)
 )
-async def update_user_preferences(user_id: str, request: UserPreferencesUpdate):
+def update_user_preferences(
+    user_id: str,
+    request: UserPreferencesUpdate = Depends(parse_preferences_update)
+):
     """
     Update user safety preferences.
     
@@ -307,57 +461,51 @@ async def update_user_preferences(user_id: str, request: UserPreferencesUpdate):
             "message": "User preferences updated successfully"
         }
     """
-    try:
-        if user_id not in users_db:
-            raise HTTPException(
-                status_code=404,
-                detail=f"User '{user_id}' not found"
-            )
-        
-        user = users_db[user_id]
-        
+    def apply_preferences(user: User) -> None:
         if request.preferred_travel_mode is not None:
-            user["preferred_travel_mode"] = request.preferred_travel_mode
+            user.preferred_travel_mode = request.preferred_travel_mode
         
         if request.night_travel is not None:
-            user["night_travel"] = request.night_travel
+            user.night_travel = request.night_travel
         
         if request.avoid_high_crime is not None:
-            user["preferences"]["avoid_high_crime"] = request.avoid_high_crime
+            user.preferences.avoid_high_crime = request.avoid_high_crime
         
         if request.prefer_well_lit is not None:
-            user["preferences"]["prefer_well_lit"] = request.prefer_well_lit
+            user.preferences.prefer_well_lit = request.prefer_well_lit
         
         if request.prefer_crowded is not None:
-            user["preferences"]["prefer_crowded"] = request.prefer_crowded
-        
-        return success_response(
-            data={
-                "user_id": user_id,
-                "preferred_travel_mode": user["preferred_travel_mode"],
-                "night_travel": user["night_travel"],
-                "preferences": user["preferences"]
-            },
-            message="User preferences updated successfully"
-        )
-    
-    except HTTPException:
-        raise
+            user.preferences.prefer_crowded = request.prefer_crowded
     
-    except Exception as e:
-        return error_response(
-            message=f"Failed to update preferences: {str(e)}",
-            status_code=500
+    user = users_db.update(user_id, apply_preferences)
+    if user is None:
+        raise HTTPException(
+            status_code=404,
+            detail=_USER_NOT_FOUND
         )
+    _render_user(user_id, user)
+    
+    return success_response(
+        data={
+            "user_id": user_id,
+            "preferred_travel_mode": user.preferred_travel_mode,
+            "night_travel": user.night_travel,
+            "preferences": user.preferences
+        },
+        message="User preferences updated successfully"
+    )
 
 
 @router.post(
     "/{user_id}/contacts",
-    response_model=Dict,
     summary="Add Emergency Contact",
-    description="Add an emergency contact to user's profile for SOS alerts"
+    description="Add an emergency contact to user's profile for SOS alerts",
+    openapi_extra=body_openapi(EmergencyContactRequest)
 )
-async def add_emergency_contact(user_id: str, request: EmergencyContactRequest):
+def add_emergency_contact(
+    user_id: str,
+    request: EmergencyContactRequest = Depends(parse_emergency_contact)
+):
     """
     Add an emergency contact to user profile.
     
@@ -400,49 +548,39 @@ async def add_emergency_contact(user_id: str, request: EmergencyContactRequest):
             "message": "Emergency contact added successfully"
         }
     """
-    try:
-        if user_id not in users_db:
-            raise HTTPException(
-                status_code=404,
-                detail=f"User '{user_id}' not found"
-            )
-        
-        user = users_db[user_id]
-        
-        contact_data = {
-            "contact_name": request.contact_name,
-            "phone_number": request.phone_number,
-            "relationship": request.relationship
-        }
-        
-        user["emergency_contacts"].append(contact_data)
-        
-        return success_response(
-            data={
-                "user_id": user_id,
-                "contacts_count": len(user["emergency_contacts"]),
-                "latest_contact": contact_data
-            },
-            message="Emergency contact added successfully"
-        )
+    contact_data = EmergencyContact(
+        contact_name=request.contact_name,
+        phone_number=request.phone_number,
+        relationship=request.relationship
+    )
     
-    except HTTPException:
-        raise
+    def append_contact(u: User) -> None:
+        u.emergency_contacts = (*u.emergency_contacts, contact_data)
     
-    except Exception as e:
-        return error_response(
-            message=f"Failed to add emergency contact: {str(e)}",
-            status_code=500
+    user = users_db.update(user_id, append_contact)
+    if user is None:
+        raise HTTPException(
+            status_code=404,
+            detail=_USER_NOT_FOUND
         )
+    _render_user(user_id, user)
+    
+    return success_response(
+        data={
+            "user_id": user_id,
+            "contacts_count": len(user.emergency_contacts),
+            "latest_contact": contact_data
+        },
+        message="Emergency contact added successfully"
+    )
 
 
 @router.get(
     "/{user_id}/contacts",
-    response_model=Dict,
     summary="Get Emergency Contacts",
     description="Retrieve all emergency contacts for a user"
 )
-async def get_emergency_contacts(user_id: str):
+def get_emergency_contacts(user_id: str):
     """
     Get all emergency contacts for a user.
     
@@ -476,41 +614,22 @@ async def get_emergency_contacts(user_id: str):
             }
         }
     """
-    try:
-        if user_id not in users_db:
-            raise HTTPException(
-                status_code=404,
-                detail=f"User '{user_id}' not found"
-            )
-        
-        user = users_db[user_id]
-        
-        return success_response(
-            data={
-                "user_id": user_id,
-                "emergency_contacts": user["emergency_contacts"],
-                "count": len(user["emergency_contacts"])
-            },
-            message=f"Retrieved {len(user['emergency_contacts'])} emergency contact(s)"
+    user = users_db.get(user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=404,
+            detail=_USER_NOT_FOUND
         )
     
-    except HTTPException:
-        raise
-    
-    except Exception as e:
-        return error_response(
-            message=f"Failed to retrieve contacts: {str(e)}",
-            status_code=500
-        )
+    return Response(content=_render_user(user_id, user).contacts_body, media_type="application/json")
 
 
 @router.delete(
     "/{user_id}",
-    response_model=Dict,
     summary="Delete User Profile",
     description="Delete a user profile and all associated data"
 )
-async def delete_user(user_id: str):
+def delete_user(user_id: str):
     """
     Delete a user profile.
     
@@ -538,28 +657,17 @@ async def delete_user(user_id: str):
             "message": "User profile deleted successfully"
         }
     """
-    try:
-        if user_id not in users_db:
-            raise HTTPException(
-                status_code=404,
-                detail=f"User '{user_id}' not found"
-            )
-        
-        del users_db[user_id]
-        
-        return success_response(
-            data={
-                "user_id": user_id,
-                "deleted": True
-            },
-            message="User profile deleted successfully"
+    if users_db.pop(user_id) is None:
+        raise HTTPException(
+            status_code=404,
+            detail=_USER_NOT_FOUND
         )
     
-    except HTTPException:
-        raise
-    
-    except Exception as e:
-        return error_response(
-            message=f"Failed to delete user: {str(e)}",
-            status_code=500
-        )
\ No newline at end of file
+    return success_response(
+        data={
+            "user_id": user_id,
+            "deleted": True
+        },
+        message="User profile deleted successfully"
+    )
+    
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+Demonstration of message formatting and usage.
+Run with: python -m app.constants._demos.demo_messages
+"""
+
+from app.constants.messages import (
+    ROUTE_DETAILS_DISTANCE,
+    ROUTE_DETAILS_DURATION,
+    ROUTE_DETAILS_SAFETY_SCORE,
+    SUCCESS_ROUTE_FOUND,
+    format_message,
+    get_route_tip,
+    get_safety_warning,
+    get_time_warning
+)
+
+print("=== Safety Route Messages Demo ===\n")
+
+# Example 1: Success message
+print("1. Route found:")
+print(format_message(SUCCESS_ROUTE_FOUND, count=3))
+print()
+
+# Example 2: Safety warnings
+print("2. Safety warnings for different scores:")
+for score in [85, 65, 45, 25]:
+    warning = get_safety_warning(score)
+    if warning:
+        print(f"Score {score}: {warning}")
+print()
+
+# Example 3: Time warnings
+print("3. Time-based warnings:")
+for hour in [2, 7, 14, 19, 23]:
+    warning = get_time_warning(hour)
+    if warning:
+        print(f"{hour:02d}:00 - {warning}")
+print()
+
+# Example 4: Route details
+print("4. Route details:")
+print(format_message(ROUTE_DETAILS_DISTANCE, distance=3.5))
+print(format_message(ROUTE_DETAILS_DURATION, duration=25))
+print(format_message(ROUTE_DETAILS_SAFETY_SCORE, score=85))
+print()
+
+# Example 5: Random tip
+print("5. Safety tip:")
+print(get_route_tip())
@@ -0,0 +1,26 @@
+"""
+Demonstration of risk label functionality.
+Run with: python -m app.constants._demos.demo_risk_labels
+"""
+
+from app.constants.risk_labels import get_all_risk_levels_info, get_risk_display_info
+
+print("=== Risk Labels Demo ===\n")
+
+# Test different safety scores
+test_scores = [95, 65, 45, 25]
+
+for score in test_scores:
+    info = get_risk_display_info(score)
+    print(f"Score {score}:")
+    print(f"  Level: {info['level']}")
+    print(f"  Label: {info['label']} {info['icon']}")
+    print(f"  Color: {info['color']}")
+    print(f"  Description: {info['short_description']}")
+    print(f"  Recommendations: {', '.join(info['recommendations'][:2])}")
+    print()
+
+# Show all risk levels
+print("\n=== All Risk Levels ===")
+for level_info in get_all_risk_levels_info():
+    print(f"{level_info['icon']} {level_info['label']}: {level_info['score_range']['label']}")
@@ -21,6 +21,11 @@ Author: Safety Route Team
 Date: January 2026
 """
 
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Optional
+
 # ============================================================================
 # SUCCESS MESSAGES
 # ============================================================================
@@ -165,6 +170,32 @@ TIP_NIGHT_SAFETY = "💡 Tip: Travel in groups when possible, especially at nigh
 TIP_EMERGENCY_NUMBERS = "💡 Tip: Keep emergency numbers saved in your phone."
 TIP_ROUTE_PLANNING = "💡 Tip: Plan your route in advance, especially for unfamiliar areas."
 
+# Pool for get_route_tip, built once
+_ROUTE_TIPS = (
+    TIP_STAY_ALERT,
+    TIP_VALUABLES,
+    TIP_TRUST_INSTINCT,
+    TIP_WELL_LIT,
+    TIP_PHONE_CHARGED,
+    TIP_SHARE_LOCATION,
+    TIP_AVOID_SHORTCUTS,
+    TIP_NIGHT_SAFETY,
+    TIP_EMERGENCY_NUMBERS,
+    TIP_ROUTE_PLANNING
+)
+
+# Relative tip weights per time-of-day context, in _ROUTE_TIPS order.
+# At night, lighting, company, charge and location sharing come up more often.
+_TIP_WEIGHTS = {
+    None: (1, 1, 1, 1, 1, 1, 1, 1, 1, 1),
+    "night": (1, 1, 1, 3, 3, 3, 1, 3, 1, 1),
+}
+
+# Cumulative weights per context, sampled with one bisect per call
+_TIP_CDFS = {
+    context: tuple(accumulate(weights)) for context, weights in _TIP_WEIGHTS.items()
+}
+
 
 # ============================================================================
 # VALIDATION MESSAGES
@@ -202,11 +233,20 @@ NOTIFICATION_SAFETY_ALERT = "Safety Alert: Avoid {area_name} due to {reason}"
 # HELPER FUNCTIONS FOR DYNAMIC MESSAGES
 # ============================================================================
 
+class _SafeFmt(dict):
+    """format_map mapping that leaves unknown placeholders in place."""
+    __slots__ = ()
+    
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
 def format_message(template: str, **kwargs) -> str:
     """
     Format a message template with provided values.
     
     Replaces placeholders in message templates with actual values.
+    Placeholders without a value are left as-is.
     
     Args:
         template (str): Message template with {placeholders}
@@ -225,11 +265,17 @@ def format_message(template: str, **kwargs) -> str:
         >>> format_message(ROUTE_DETAILS_SAFETY_SCORE, score=85)
         'Safety Score: 85/100'
     """
-    try:
-        return template.format(**kwargs)
-    except KeyError as e:
-        # If placeholder is missing, return template as-is
-        return template
+    return template.format_map(_SafeFmt(kwargs))
+
+
+# Lower score bounds of the high/moderate/no-warning bands (see get_safety_warning)
+_WARNING_THRESHOLDS = (40, 50, 80)
+_WARNINGS_BY_BAND = (
+    WARNING_CRITICAL_RISK,
+    WARNING_HIGH_RISK,
+    WARNING_MODERATE_RISK,
+    ""  # No warning needed
+)
 
 
 def get_safety_warning(score: float) -> str:
@@ -255,14 +301,24 @@ def get_safety_warning(score: float) -> str:
         >>> get_safety_warning(25)
         '🚫 CRITICAL: This route is dangerous. Do NOT proceed. Select a different route.'
     """
-    if score >= 80:
-        return ""  # No warning needed
-    elif score >= 50:
-        return WARNING_MODERATE_RISK
-    elif score >= 40:
-        return WARNING_HIGH_RISK
-    else:
+    # NaN compares false to every bound, which bisect would place in the
+    # no-warning band; an unknown score gets the critical warning
+    if score != score:
         return WARNING_CRITICAL_RISK
+    return _WARNINGS_BY_BAND[bisect_right(_WARNING_THRESHOLDS, score)]
+
+
+def _build_time_warning(hour: int) -> str:
+    if 22 <= hour or hour < 5:  # Night (10 PM - 5 AM)
+        return format_message(WARNING_LATE_HOURS, time=f"{hour:02d}:00")
+    elif 5 <= hour < 7 or 18 <= hour < 20:  # Dawn/Dusk
+        return WARNING_DAWN_DUSK
+    else:
+        return ""  # No warning during day
+
+
+# Warning for every hour of the day, formatted once
+_TIME_WARNINGS = tuple(_build_time_warning(hour) for hour in range(24))
 
 
 def get_time_warning(hour: int) -> str:
@@ -285,18 +341,19 @@ def get_time_warning(hour: int) -> str:
         >>> get_time_warning(19)  # 7 PM (dusk)
         'Visibility is reduced during dawn/dusk hours. Stay on well-lit paths.'
     """
-    if 22 <= hour or hour < 5:  # Night (10 PM - 5 AM)
-        return format_message(WARNING_LATE_HOURS, time=f"{hour:02d}:00")
-    elif 5 <= hour < 7 or 18 <= hour < 20:  # Dawn/Dusk
-        return WARNING_DAWN_DUSK
-    else:
-        return ""  # No warning during day
+    if 0 <= hour < 24:
+        return _TIME_WARNINGS[hour]
+    return _build_time_warning(hour)
 
 
-def get_route_tip() -> str:
+def get_route_tip(context: Optional[str] = None) -> str:
     """
     Get a random safety tip for users.
     
+    Args:
+        context (str, optional): Time-of-day context such as "night" that makes
+            relevant tips more likely; unknown contexts weight all tips equally
+    
     Returns:
         str: A random safety tip
     
@@ -305,62 +362,5 @@ def get_route_tip() -> str:
         >>> print(tip)
         '💡 Tip: Stay alert and aware of your surroundings at all times.'
     """
-    import random
-    
-    tips = [
-        TIP_STAY_ALERT,
-        TIP_VALUABLES,
-        TIP_TRUST_INSTINCT,
-        TIP_WELL_LIT,
-        TIP_PHONE_CHARGED,
-        TIP_SHARE_LOCATION,
-        TIP_AVOID_SHORTCUTS,
-        TIP_NIGHT_SAFETY,
-        TIP_EMERGENCY_NUMBERS,
-        TIP_ROUTE_PLANNING
-    ]
-    
-    return random.choice(tips)
-
-
-# ============================================================================
-# EXAMPLE USAGE
-# ============================================================================
-
-if __name__ == "__main__":
-    """
-    Demonstration of message formatting and usage.
-    """
-    print("=== Safety Route Messages Demo ===\n")
-    
-    # Example 1: Success message
-    print("1. Route found:")
-    print(format_message(SUCCESS_ROUTE_FOUND, count=3))
-    print()
-    
-    # Example 2: Safety warnings
-    print("2. Safety warnings for different scores:")
-    for score in [85, 65, 45, 25]:
-        warning = get_safety_warning(score)
-        if warning:
-            print(f"Score {score}: {warning}")
-    print()
-    
-    # Example 3: Time warnings
-    print("3. Time-based warnings:")
-    for hour in [2, 7, 14, 19, 23]:
-        warning = get_time_warning(hour)
-        if warning:
-            print(f"{hour:02d}:00 - {warning}")
-    print()
-    
-    # Example 4: Route details
-    print("4. Route details:")
-    print(format_message(ROUTE_DETAILS_DISTANCE, distance=3.5))
-    print(format_message(ROUTE_DETAILS_DURATION, duration=25))
-    print(format_message(ROUTE_DETAILS_SAFETY_SCORE, score=85))
-    print()
-    
-    # Example 5: Random tip
-    print("5. Safety tip:")
-    print(get_route_tip())
\ No newline at end of file
+    cdf = _TIP_CDFS.get(context, _TIP_CDFS[None])
+    return _ROUTE_TIPS[bisect_right(cdf, random.random() * cdf[-1])]
@@ -15,17 +15,21 @@ Author: Safety Route Team
 Date: January 2026
 """
 
-from typing import Dict, List
+import sys
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Any, Iterable, List, Mapping, Tuple
 
 # ============================================================================
 # RISK LEVEL CATEGORIES
 # ============================================================================
 
-# Primary risk categories used throughout the application
-RISK_LEVEL_SAFE = "safe"
-RISK_LEVEL_MODERATE = "moderate"
-RISK_LEVEL_RISKY = "risky"
-RISK_LEVEL_DANGEROUS = "dangerous"
+# Primary risk categories used throughout the application. Interned so lookups
+# in the read-only tables below match keys by identity.
+RISK_LEVEL_SAFE = sys.intern("safe")
+RISK_LEVEL_MODERATE = sys.intern("moderate")
+RISK_LEVEL_RISKY = sys.intern("risky")
+RISK_LEVEL_DANGEROUS = sys.intern("dangerous")
 
 # All valid risk levels in order from safest to most dangerous
 ALL_RISK_LEVELS = [
@@ -40,28 +44,28 @@ ALL_RISK_LEVELS = [
 # RISK LEVEL DISPLAY LABELS
 # ============================================================================
 
-RISK_LABELS = {
+RISK_LABELS = MappingProxyType({
     "safe": "Safe Route",
     "moderate": "Moderate Risk",
     "risky": "High Risk",
     "dangerous": "Dangerous Route"
-}
+})
 
 # Short labels for compact UI displays (mobile, map markers)
-RISK_LABELS_SHORT = {
+RISK_LABELS_SHORT = MappingProxyType({
     "safe": "Safe",
     "moderate": "Caution",
     "risky": "Risky",
     "dangerous": "Danger"
-}
+})
 
 # Detailed labels with additional context
-RISK_LABELS_DETAILED = {
+RISK_LABELS_DETAILED = MappingProxyType({
     "safe": "Safe - Recommended Route",
     "moderate": "Moderate Risk - Exercise Caution",
     "risky": "High Risk - Not Recommended",
     "dangerous": "Dangerous - Avoid This Route"
-}
+})
 
 
 # ============================================================================
@@ -69,28 +73,28 @@ RISK_LABELS_DETAILED = {
 # ============================================================================
 
 # Standard colors for UI display (hex codes)
-RISK_COLORS = {
+RISK_COLORS = MappingProxyType({
     "safe": "#00C851",      # Green - Go ahead
     "moderate": "#FFB700",  # Yellow/Amber - Proceed with caution
     "risky": "#FF8800",     # Orange - Warning
     "dangerous": "#FF4444"  # Red - Stop/Danger
-}
+})
 
 # Alternative color scheme for dark mode
-RISK_COLORS_DARK_MODE = {
+RISK_COLORS_DARK_MODE = MappingProxyType({
     "safe": "#00E676",      # Brighter green
     "moderate": "#FFC107",  # Brighter yellow
     "risky": "#FF9800",     # Brighter orange
     "dangerous": "#F44336"  # Brighter red
-}
+})
 
 # RGB values for map rendering or custom graphics
-RISK_COLORS_RGB = {
+RISK_COLORS_RGB = MappingProxyType({
     "safe": (0, 200, 81),
     "moderate": (255, 183, 0),
     "risky": (255, 136, 0),
     "dangerous": (255, 68, 68)
-}
+})
 
 
 # ============================================================================
@@ -98,28 +102,29 @@ RISK_COLORS_RGB = {
 # ============================================================================
 
 # Unicode emoji icons for quick visual identification
-RISK_ICONS = {
-    "safe": "✅",           # Check mark - approved
-    "moderate": "⚠️",       # Warning sign - caution
-    "risky": "❗",          # Exclamation - alert
-    "dangerous": "🚫"       # Prohibited - stop
-}
+# (escaped so a re-encoded source file cannot corrupt them)
+RISK_ICONS = MappingProxyType({
+    "safe": "\u2705",            # ✅ Check mark - approved
+    "moderate": "\u26a0\ufe0f",  # ⚠️ Warning sign - caution
+    "risky": "\u2757",           # ❗ Exclamation - alert
+    "dangerous": "\U0001f6ab"    # 🚫 Prohibited - stop
+})
 
 # Alternative text-based icons (for environments without emoji support)
-RISK_ICONS_TEXT = {
+RISK_ICONS_TEXT = MappingProxyType({
     "safe": "[OK]",
     "moderate": "[!]",
     "risky": "[!!]",
     "dangerous": "[X]"
-}
+})
 
 # Font Awesome icon classes (if using Font Awesome in frontend)
-RISK_ICONS_FA = {
+RISK_ICONS_FA = MappingProxyType({
     "safe": "fa-check-circle",
     "moderate": "fa-exclamation-triangle",
     "risky": "fa-exclamation-circle",
     "dangerous": "fa-times-circle"
-}
+})
 
 
 # ============================================================================
@@ -127,7 +132,7 @@ RISK_ICONS_FA = {
 # ============================================================================
 
 # User-friendly descriptions explaining what each risk level means
-RISK_DESCRIPTIONS = {
+RISK_DESCRIPTIONS = MappingProxyType({
     "safe": (
         "This route has excellent safety ratings across all factors. "
         "Crime rates are low, lighting is good, and crowd density is optimal. "
@@ -148,15 +153,15 @@ RISK_DESCRIPTIONS = {
         "Critical safety factors such as high crime, no lighting, or isolated areas detected. "
         "Please select a different route immediately."
     )
-}
+})
 
 # Short descriptions for tooltips or mobile UI
-RISK_DESCRIPTIONS_SHORT = {
+RISK_DESCRIPTIONS_SHORT = MappingProxyType({
     "safe": "Low risk. Safe to proceed.",
     "moderate": "Some risk. Stay alert.",
     "risky": "High risk. Not recommended.",
     "dangerous": "Critical risk. Avoid this route."
-}
+})
 
 
 # ============================================================================
@@ -164,7 +169,7 @@ RISK_DESCRIPTIONS_SHORT = {
 # ============================================================================
 
 # Action recommendations for users based on risk level
-RISK_RECOMMENDATIONS = {
+RISK_RECOMMENDATIONS = MappingProxyType({
     "safe": [
         "Enjoy your journey",
         "Maintain normal awareness",
@@ -192,7 +197,7 @@ RISK_RECOMMENDATIONS = {
         "Use our SOS feature if you feel unsafe",
         "Share your location with emergency contacts"
     ]
-}
+})
 
 
 # ============================================================================
@@ -201,7 +206,7 @@ RISK_RECOMMENDATIONS = {
 
 # Score thresholds for each risk category
 # These map safety scores (0-100) to risk levels
-RISK_SCORE_RANGES = {
+RISK_SCORE_RANGES = MappingProxyType({
     "safe": {
         "min": 80,
         "max": 100,
@@ -222,13 +227,24 @@ RISK_SCORE_RANGES = {
         "max": 39,
         "label": "0-39"
     }
-}
+})
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Lower score bounds of the risky/moderate/safe bands, and the level for each
+# band in ascending order; bisect_right places a score in its band
+_LEVEL_THRESHOLDS = (40, 50, 80)
+_LEVELS_BY_BAND = (
+    RISK_LEVEL_DANGEROUS,
+    RISK_LEVEL_RISKY,
+    RISK_LEVEL_MODERATE,
+    RISK_LEVEL_SAFE
+)
+
+
 def get_risk_level_from_score(score: float) -> str:
     """
     Convert a numeric safety score to a risk level category.
@@ -260,17 +276,60 @@ def get_risk_level_from_score(score: float) -> str:
         >>> print(f"{label}: {color}")
         Moderate Risk: #FFB700
     """
-    if score >= 80:
-        return RISK_LEVEL_SAFE
-    elif score >= 50:
-        return RISK_LEVEL_MODERATE
-    elif score >= 40:
-        return RISK_LEVEL_RISKY
-    else:
+    # NaN compares false to every bound, which bisect would place in the
+    # safest band; an unknown score must not pass as safe
+    if score != score:
         return RISK_LEVEL_DANGEROUS
+    return _LEVELS_BY_BAND[bisect_right(_LEVEL_THRESHOLDS, score)]
 
 
-def get_risk_display_info(score: float) -> Dict[str, str]:
+def get_risk_levels_from_scores(scores: Iterable[float]) -> List[str]:
+    """
+    Batch form of get_risk_level_from_score for scoring many routes at once.
+    
+    Args:
+        scores (Iterable[float]): Safety scores (0-100)
+    
+    Returns:
+        List[str]: Risk level for each score, in input order
+    
+    Example:
+        >>> get_risk_levels_from_scores([85, 65, 45, 25])
+        ['safe', 'moderate', 'risky', 'dangerous']
+    """
+    levels, thresholds = _LEVELS_BY_BAND, _LEVEL_THRESHOLDS
+    # NaN (score != score) is dangerous, as in get_risk_level_from_score
+    return [
+        levels[bisect_right(thresholds, score)] if score == score else RISK_LEVEL_DANGEROUS
+        for score in scores
+    ]
+
+
+# Complete display payload per risk level, built once at import
+_RISK_DISPLAY_INFO = {
+    level: MappingProxyType({
+        "level": level,
+        "label": RISK_LABELS[level],
+        "label_short": RISK_LABELS_SHORT[level],
+        "color": RISK_COLORS[level],
+        "icon": RISK_ICONS[level],
+        "description": RISK_DESCRIPTIONS[level],
+        "short_description": RISK_DESCRIPTIONS_SHORT[level],
+        "recommendations": RISK_RECOMMENDATIONS[level],
+        "score_range": RISK_SCORE_RANGES[level]["label"]
+    })
+    for level in ALL_RISK_LEVELS
+}
+
+
+# Payload per whole score 0-100. Band bounds are whole numbers, so truncating
+# any score in range lands in the same band.
+_RISK_DISPLAY_INFO_BY_SCORE = tuple(
+    _RISK_DISPLAY_INFO[get_risk_level_from_score(score)] for score in range(101)
+)
+
+
+def get_risk_display_info(score: float) -> Mapping[str, Any]:
     """
     Get complete display information for a safety score.
     
@@ -281,7 +340,7 @@ def get_risk_display_info(score: float) -> Dict[str, str]:
         score (float): Safety score (0-100)
     
     Returns:
-        Dict containing:
+        Read-only mapping shared by all callers (copy with dict() to modify):
             - level: Risk category
             - label: Display label
             - color: Hex color code
@@ -305,22 +364,26 @@ def get_risk_display_info(score: float) -> Dict[str, str]:
         ... }
         >>> # Returns complete UI info for frontend
     """
-    risk_level = get_risk_level_from_score(score)
-    
-    return {
-        "level": risk_level,
-        "label": RISK_LABELS[risk_level],
-        "label_short": RISK_LABELS_SHORT[risk_level],
-        "color": RISK_COLORS[risk_level],
-        "icon": RISK_ICONS[risk_level],
-        "description": RISK_DESCRIPTIONS[risk_level],
-        "short_description": RISK_DESCRIPTIONS_SHORT[risk_level],
-        "recommendations": RISK_RECOMMENDATIONS[risk_level],
-        "score_range": RISK_SCORE_RANGES[risk_level]["label"]
-    }
-
-
-def get_all_risk_levels_info() -> List[Dict]:
+    if 0 <= score <= 100:
+        return _RISK_DISPLAY_INFO_BY_SCORE[int(score)]
+    return _RISK_DISPLAY_INFO[get_risk_level_from_score(score)]
+
+
+# Legend entries for every level, safest first, built once at import
+_ALL_RISK_LEVELS_INFO = tuple(
+    MappingProxyType({
+        "level": level,
+        "label": RISK_LABELS[level],
+        "color": RISK_COLORS[level],
+        "icon": RISK_ICONS[level],
+        "score_range": RISK_SCORE_RANGES[level],
+        "description": RISK_DESCRIPTIONS_SHORT[level]
+    })
+    for level in ALL_RISK_LEVELS
+)
+
+
+def get_all_risk_levels_info() -> Tuple[Mapping[str, Any], ...]:
     """
     Get information about all risk levels.
     
@@ -330,7 +393,7 @@ def get_all_risk_levels_info() -> List[Dict]:
     - Help/tutorial screens
     
     Returns:
-        List[Dict]: Information for each risk level
+        Tuple of read-only mappings, one per risk level (shared; copy to modify)
     
     Example:
         >>> levels = get_all_risk_levels_info()
@@ -341,17 +404,7 @@ def get_all_risk_levels_info() -> List[Dict]:
         High Risk: 40-49
         Dangerous Route: 0-39
     """
-    return [
-        {
-            "level": level,
-            "label": RISK_LABELS[level],
-            "color": RISK_COLORS[level],
-            "icon": RISK_ICONS[level],
-            "score_range": RISK_SCORE_RANGES[level],
-            "description": RISK_DESCRIPTIONS_SHORT[level]
-        }
-        for level in ALL_RISK_LEVELS
-    ]
+    return _ALL_RISK_LEVELS_INFO
 
 
 def is_safe_route(score: float) -> bool:
@@ -413,31 +466,31 @@ def requires_warning(score: float) -> bool:
     return score < 50
 
 
-# ============================================================================
-# EXAMPLE USAGE
-# ============================================================================
+# Flags returned by classify_route_score
+SAFE_BIT = 1
+DANGEROUS_BIT = 2
+WARN_BIT = 4
 
-if __name__ == "__main__":
-    """
-    Demonstration of risk label functionality.
-    Run this file directly to see sample outputs.
+
+def classify_route_score(score: float) -> int:
     """
-    print("=== Risk Labels Demo ===\n")
+    Combine is_safe_route, is_dangerous_route and requires_warning in one call.
     
-    # Test different safety scores
-    test_scores = [95, 65, 45, 25]
+    Args:
+        score (float): Safety score
     
-    for score in test_scores:
-        info = get_risk_display_info(score)
-        print(f"Score {score}:")
-        print(f"  Level: {info['level']}")
-        print(f"  Label: {info['label']} {info['icon']}")
-        print(f"  Color: {info['color']}")
-        print(f"  Description: {info['short_description']}")
-        print(f"  Recommendations: {', '.join(info['recommendations'][:2])}")
-        print()
+    Returns:
+        int: Bitmask of SAFE_BIT, DANGEROUS_BIT and WARN_BIT
     
-    # Show all risk levels
-    print("\n=== All Risk Levels ===")
-    for level_info in get_all_risk_levels_info():
-        print(f"{level_info['icon']} {level_info['label']}: {level_info['score_range']['label']}")
\ No newline at end of file
+    Example:
+        >>> flags = classify_route_score(35)
+        >>> bool(flags & DANGEROUS_BIT), bool(flags & WARN_BIT)
+        (True, True)
+        >>> classify_route_score(90) == SAFE_BIT
+        True
+    """
+    return (
+        (SAFE_BIT if score >= 80 else 0)
+        | (DANGEROUS_BIT if score < 40 else 0)
+        | (WARN_BIT if score < 50 else 0)
+    )
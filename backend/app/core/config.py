@@ -1,22 +1,58 @@
-from pydantic_settings import BaseSettings
-from functools import lru_cache
+from pydantic import SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cached_property, lru_cache
+from typing import Dict, Tuple
+
+API_KEY_NAMES = ("ANTHROPIC_API_KEY", "OPENAI_API_KEY", "HF_API_TOKEN", "GOOGLE_MAPS_API_KEY")
+
+
+class Secrets(BaseSettings):
+    """
+    API keys, read only when a client first asks for them.
+    SecretStr keeps the values out of reprs and logs; use get_secret_value().
+    """
+    model_config = SettingsConfigDict(
+        env_file=".env", case_sensitive=True, frozen=True, extra="ignore"
+    )
+    
+    ANTHROPIC_API_KEY: SecretStr = SecretStr("")
+    OPENAI_API_KEY: SecretStr = SecretStr("")
+    HF_API_TOKEN: SecretStr = SecretStr("")
+    GOOGLE_MAPS_API_KEY: SecretStr = SecretStr("")
+    
+    def configured_keys(self) -> Dict[str, bool]:
+        """Which API keys are set, keyed by lower-case name."""
+        return {name.lower(): bool(getattr(self, name).get_secret_value()) for name in API_KEY_NAMES}
 
 
 class Settings(BaseSettings):
+    # Values are coerced once by pydantic-core and cannot change afterwards.
+    # extra="ignore" lets .env also hold the keys read by Secrets.
+    model_config = SettingsConfigDict(
+        env_file=".env", case_sensitive=True, frozen=True, extra="ignore"
+    )
+    
     APP_NAME: str = "SafetyNavigationAPI"
     DEBUG: bool = True
     LOG_LEVEL: str = "INFO"
     
     DATABASE_URL: str = "sqlite:///./safety_nav.db"
     
-    ANTHROPIC_API_KEY: str = ""
-    OPENAI_API_KEY: str = ""
-    HF_API_TOKEN: str = ""
-    GOOGLE_MAPS_API_KEY: str = ""
+    # Comma-separated; "*" is for testing - remove in production
+    CORS_ORIGINS: str = (
+        "http://localhost:3000,http://localhost:5173,"
+        "http://127.0.0.1:3000,http://127.0.0.1:5173,*"
+    )
+    
+    @cached_property
+    def secrets(self) -> Secrets:
+        """API keys; routes that never call an AI or maps client skip loading them."""
+        return Secrets()
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    @cached_property
+    def cors_origins(self) -> Tuple[str, ...]:
+        """CORS_ORIGINS split once per process."""
+        return tuple(origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip())
 
 
 @lru_cache()
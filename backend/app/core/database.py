@@ -7,36 +7,30 @@ Provides in-memory storage for hackathon MVP.
 import threading
 from typing import Any, Dict, Optional
 
-# Global in-memory storage
-_storage: Dict[str, Dict[str, Any]] = {}
+# Global in-memory storage. None until connected; a connect publishes a fully
+# built dict in one assignment, so readers never need the lock.
+_storage: Optional[Dict[str, Dict[str, Any]]] = None
 _lock = threading.Lock()
-_connected = False
 
+COLLECTIONS = ("users", "trips", "reports", "emergencies", "contacts")
 
-def connect() -> None:
+
+def connect() -> Dict[str, Dict[str, Any]]:
     """Initialize database connection (in-memory for MVP)."""
-    global _connected
+    global _storage
     with _lock:
-        if not _connected:
-            _storage.clear()
-            _storage.update({
-                "users": {},
-                "trips": {},
-                "reports": {},
-                "emergencies": {},
-                "contacts": {}
-            })
-            _connected = True
+        if _storage is None:
+            _storage = {name: {} for name in COLLECTIONS}
             print("[DATABASE] Connected to in-memory storage")
+        return _storage
 
 
 def disconnect() -> None:
     """Close database connection and clear storage."""
-    global _connected
+    global _storage
     with _lock:
-        if _connected:
-            _storage.clear()
-            _connected = False
+        if _storage is not None:
+            _storage = None
             print("[DATABASE] Disconnected and cleared storage")
 
 
@@ -45,19 +39,21 @@ def get_db() -> Dict[str, Dict[str, Any]]:
     Get reference to in-memory database.
     Returns dictionary with table-like collections.
     """
-    if not _connected:
-        connect()
-    return _storage
+    storage = _storage
+    if storage is None:
+        return connect()
+    return storage
 
 
 def is_connected() -> bool:
     """Check if database is connected."""
-    return _connected
+    return _storage is not None
 
 
 def reset_storage() -> None:
     """Reset all collections to empty state (useful for testing)."""
     with _lock:
-        for collection in _storage.values():
-            collection.clear()
-        print("[DATABASE] Storage reset")
\ No newline at end of file
+        if _storage is not None:
+            for collection in _storage.values():
+                collection.clear()
+        print("[DATABASE] Storage reset")
@@ -6,24 +6,24 @@ Centralized logging configuration for Safety Route backend.
 import logging
 import os
 import sys
+from functools import cache, lru_cache
 from typing import Optional
 
-_loggers = {}
-_configured = False
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET")
+}
 
 
+@cache
 def _configure_logging() -> None:
-    global _configured
-    if _configured:
-        return
-    
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
     env = os.getenv("ENV", "development").lower()
     
     if env == "development":
         log_level = "DEBUG"
     
-    level = getattr(logging, log_level, logging.INFO)
+    level = _LEVELS.get(log_level, logging.INFO)
     
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
@@ -35,25 +35,18 @@ def _configure_logging() -> None:
         stream=sys.stdout,
         force=True
     )
-    
-    _configured = True
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
-    if name in _loggers:
-        return _loggers[name]
-    
     _configure_logging()
     
     logger = logging.getLogger(name)
     logger.propagate = True
-    
-    _loggers[name] = logger
-    
     return logger
 
 
 def set_log_level(level: str) -> None:
     _configure_logging()
-    log_level = getattr(logging, level.upper(), logging.INFO)
+    log_level = _LEVELS.get(level.upper(), logging.INFO)
     logging.getLogger().setLevel(log_level)
\ No newline at end of file
@@ -1,94 +1,163 @@
-from fastapi import FastAPI
+import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
+from functools import cache
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes import route, report, sos, safety, geocoding  # Add geocoding
-
-app = FastAPI(
-    title="Safety Route API",
-    description="AI-assisted navigation backend prioritizing user safety over fastest routes",
-    version="1.0.0"
-)
-
-# CORS Configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:5173",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:5173",
-        "*"  # Add this for testing - remove in production
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Register route planning APIs
-app.include_router(
-    route.router,
-    prefix="/routes",
-    tags=["Routes"]
-)
-
-# Register report / safety / incident APIs
-app.include_router(
-    report.router,
-    prefix="/reports",
-    tags=["Reports"]
-)
-
-app.include_router(
-    sos.router,
-    prefix="/sos",
-    tags=["SOS"]
-)
-
-# Register safety analysis API
-app.include_router(
-    safety.router,
-    prefix="/safety",
-    tags=["Safety"]
-)
-
-# Register geocoding API (NEW)
-app.include_router(
-    geocoding.router,
-    tags=["Geocoding"]
-)
-
-# Root endpoint
-@app.get("/")
-async def root():
-    return {
-        "message": "Safety Route API is running",
-        "status": "healthy",
-        "version": "1.0.0",
-        "endpoints": {
-            "routes": "/routes",
-            "reports": "/reports",
-            "sos": "/sos",
-            "safety": "/safety",
-            "geocoding": "/geocoding",
-            "docs": "/docs"
+from fastapi.middleware.gzip import GZipMiddleware
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.utils.response_utils import ORJSONResponse, error_response
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Explicit CORS lists let Starlette build its preflight headers once at startup
+CORS_ALLOWED_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS")
+CORS_ALLOWED_HEADERS = ("authorization", "if-none-match")  # plus the CORS-safelisted ones
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # uvicorn[standard] makes uvicorn pick uvloop and httptools automatically;
+    # flag deployments that silently fell back to the slower stdlib stack
+    loop_module = type(asyncio.get_running_loop()).__module__
+    if not loop_module.startswith("uvloop"):
+        logger.warning("Event loop is %s, not uvloop; install uvicorn[standard]", loop_module)
+    if importlib.util.find_spec("httptools") is None:
+        logger.warning("httptools not installed; uvicorn will use the slower h11 parser")
+    from app.api.routes import sos
+
+    # The SOS alert writer lives on this loop and is drained before exit
+    await sos.start_persistence()
+    try:
+        yield
+    finally:
+        await sos.stop_persistence()
+
+
+def include_api_routers(app: FastAPI) -> None:
+    """
+    Import and register the API routers; called by create_app().
+    The imports happen here rather than at module top: these modules pull in
+    the AI and maps clients, which importing app.main alone (tooling, health
+    probes) does not need. Registration never waits for startup events, so
+    hosts that skip the lifespan still serve every endpoint.
+    """
+    from app.api.routes import route, report, sos, safety, geocoding  # Add geocoding
+
+    # Register route planning APIs
+    app.include_router(
+        route.router,
+        prefix="/routes",
+        tags=["Routes"]
+    )
+
+    # Register report / safety / incident APIs
+    app.include_router(
+        report.router,
+        prefix="/reports",
+        tags=["Reports"]
+    )
+
+    app.include_router(
+        sos.router,
+        prefix="/sos",
+        tags=["SOS"]
+    )
+
+    # Register safety analysis API
+    app.include_router(
+        safety.router,
+        prefix="/safety",
+        tags=["Safety"]
+    )
+
+    # Register geocoding API (NEW)
+    app.include_router(
+        geocoding.router,
+        tags=["Geocoding"]
+    )
+
+
+# Single fallback for unexpected errors, so handlers need no catch-all blocks
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path)
+    return ORJSONResponse(
+        content=error_response(message=f"Internal server error: {exc}", status_code=500),
+        status_code=500
+    )
+
+
+@cache
+def create_app() -> FastAPI:
+    """Build the API once per process; later calls return the same app."""
+    app = FastAPI(
+        title="Safety Route API",
+        description="AI-assisted navigation backend prioritizing user safety over fastest routes",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        # Production (DEBUG=false) serves no docs, so the OpenAPI schema is never built
+        openapi_url="/openapi.json" if settings.DEBUG else None,
+        docs_url="/docs" if settings.DEBUG else None,
+        redoc_url="/redoc" if settings.DEBUG else None
+    )
+
+    app.add_exception_handler(Exception, unhandled_exception_handler)
+
+    include_api_routers(app)
+
+    # CORS Configuration
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=CORS_ALLOWED_METHODS,
+        allow_headers=CORS_ALLOWED_HEADERS,
+    )
+
+    # Compress JSON bodies over 512 bytes; level 4 keeps CPU cost low for a good ratio
+    app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
+
+    # Root endpoint
+    @app.get("/")
+    async def root():
+        return {
+            "message": "Safety Route API is running",
+            "status": "healthy",
+            "version": "1.0.0",
+            "endpoints": {
+                "routes": "/routes",
+                "reports": "/reports",
+                "sos": "/sos",
+                "safety": "/safety",
+                "geocoding": "/geocoding",
+                "docs": app.docs_url
+            }
         }
-    }
-
-# Health check
-@app.get("/health")
-def health_check():
-    return {
-        "status": "ok",
-        "message": "Safety Route backend is running"
-    }
-from fastapi.middleware.cors import CORSMiddleware
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    # Health check
+    @app.get("/health")
+    def health_check():
+        return {
+            "status": "ok",
+            "message": "Safety Route backend is running"
+        }
+
+    @app.get("/ping")
+    def ping():
+        return {"status": "ok", "message": "backend connected"}
+
+    return app
+
 
-@app.get("/ping")
-def ping():
-    return {"status": "ok", "message": "backend connected"}
+def __getattr__(name: str):
+    """
+    Build the app on first access to app.main.app (uvicorn app.main:app,
+    `from app.main import app`), so a bare `import app.main` stays cheap.
+    """
+    if name == "app":
+        return create_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
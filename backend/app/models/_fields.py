@@ -0,0 +1,12 @@
+from datetime import datetime, timezone
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+# E.164 phone number, shared so every model validates it with the same pattern
+PhoneNumberStr = Annotated[str, StringConstraints(pattern=r'^\+?[1-9]\d{1,14}$')]
+
+
+def utc_now() -> datetime:
+    """Timezone-aware replacement for the deprecated datetime.utcnow."""
+    return datetime.now(timezone.utc)
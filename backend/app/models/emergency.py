@@ -1,7 +1,8 @@
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Optional
+from ._fields import utc_now
 
 
 class EmergencyType(str, Enum):
@@ -21,11 +22,13 @@ class EmergencyStatus(str, Enum):
 
 
 class EmergencyEvent(BaseModel):
+    model_config = ConfigDict(use_enum_values=True)
+    
     emergency_id: str
     user_id: str
     latitude: float = Field(..., ge=-90, le=90)
     longitude: float = Field(..., ge=-180, le=180)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
     emergency_type: EmergencyType
     status: EmergencyStatus = EmergencyStatus.TRIGGERED
     description: Optional[str] = None
@@ -1,7 +1,8 @@
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Optional
+from ._fields import utc_now
 
 
 class ReportType(str, Enum):
@@ -22,6 +23,8 @@ class ReportStatus(str, Enum):
 
 
 class SafetyReport(BaseModel):
+    model_config = ConfigDict(use_enum_values=True)
+    
     report_id: str
     user_id: str
     latitude: float = Field(..., ge=-90, le=90)
@@ -29,7 +32,7 @@ class SafetyReport(BaseModel):
     report_type: ReportType
     description: str
     severity: Optional[int] = Field(default=3, ge=1, le=5)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     status: ReportStatus = ReportStatus.SUBMITTED
     image_urls: list[str] = Field(default_factory=list)
     is_anonymous: bool = False
\ No newline at end of file
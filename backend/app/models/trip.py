@@ -1,5 +1,5 @@
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Optional
 
@@ -12,6 +12,8 @@ class TripStatus(str, Enum):
 
 
 class Trip(BaseModel):
+    model_config = ConfigDict(use_enum_values=True)
+    
     trip_id: str
     user_id: str
     start_latitude: float = Field(..., ge=-90, le=90)
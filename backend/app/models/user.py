@@ -1,6 +1,7 @@
 from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
 from typing import Optional
+from ._fields import PhoneNumberStr, utc_now
 from .contact import EmergencyContact
 
 
@@ -8,9 +9,9 @@ class User(BaseModel):
     user_id: str
     name: str = Field(..., min_length=1)
     email: Optional[EmailStr] = None
-    phone_number: str = Field(..., pattern=r'^\+?[1-9]\d{1,14}$')
+    phone_number: PhoneNumberStr
     emergency_contacts: list[EmergencyContact] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     is_active: bool = True
     last_known_latitude: Optional[float] = Field(default=None, ge=-90, le=90)
     last_known_longitude: Optional[float] = Field(default=None, ge=-180, le=180)
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+from functools import cached_property
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -27,6 +28,9 @@ class SeverityLevel(int, Enum):
 
 
 class ReportCreate(BaseModel):
+    # Store plain values so stored reports serialize without enum dispatch
+    model_config = ConfigDict(use_enum_values=True)
+    
     latitude: float = Field(..., ge=-90, le=90, description="Latitude coordinate")
     longitude: float = Field(..., ge=-180, le=180, description="Longitude coordinate")
     category: ReportCategory = Field(..., description="Type of safety concern")
@@ -70,11 +74,13 @@ class NearbyReportsResponse(BaseModel):
     risk_level: Optional[str] = Field(None, description="Categorical risk: Safe/Moderate/Risky/Dangerous")
     dominant_categories: Optional[List[str]] = Field(None, description="Most common report types in area")
     
-    @property
+    @computed_field
+    @cached_property
     def is_safe(self) -> bool:
         return self.area_risk_score < 30
     
-    @property
+    @computed_field
+    @cached_property
     def needs_warning(self) -> bool:
         return self.area_risk_score >= 50
 
@@ -1,9 +1,25 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict, Any
+from __future__ import annotations
+
+import math
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
+from typing import Annotated, Any, Literal
 from datetime import datetime
 from enum import Enum
 
 
+def _now_iso() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _default_notif_prefs() -> dict[str, bool]:
+    return {
+        "email": True,
+        "push": True,
+        "sms": False
+    }
+
+
 class RiskLevel(str, Enum):
     SAFE = "safe"
     MODERATE = "moderate"
@@ -26,124 +42,174 @@ class SafetyPreference(str, Enum):
     TIME_PRIORITY = "time_priority"
 
 
+# Leaf models built in bulk (per point, factor, segment): immutable and never
+# re-validated when handed on to another model
+_LEAF_CONFIG = ConfigDict(extra='ignore', frozen=True, revalidate_instances='never')
+
+
+# Shared constrained types, so every score/coordinate field reuses one definition
+_Score100 = Annotated[int, Field(ge=0, le=100)]
+_Lat = Annotated[float, Field(ge=-90, le=90)]
+_Lng = Annotated[float, Field(ge=-180, le=180)]
+_Ratio = Annotated[float, Field(ge=0.0, le=1.0)]
+
+# Plain string sets for the busiest models: pydantic checks a Literal without
+# the Enum coercion step. The Enums stay for code that wants .value/.name.
+_RiskLevelLit = Literal["safe", "moderate", "risky", "dangerous"]
+_SafetyPreferenceLit = Literal["maximum_safety", "balanced", "time_priority"]
+
+
 class RoutePoint(BaseModel):
-    latitude: float = Field(..., ge=-90, le=90)
-    longitude: float = Field(..., ge=-180, le=180)
-    address: Optional[str] = None
+    model_config = _LEAF_CONFIG
+
+    latitude: _Lat
+    longitude: _Lng
+    address: str | None = None
+
+    @cached_property
+    def _trig(self) -> tuple[float, float, float]:
+        """(lat_rad, cos_lat, sin_lat), computed once per point."""
+        lat_rad = math.radians(self.latitude)
+        return lat_rad, math.cos(lat_rad), math.sin(lat_rad)
+
+    def distance_km(self, other: "RoutePoint") -> float:
+        """Haversine distance in km, reusing each point's cached latitude trig."""
+        lat1, cos_lat1, _ = self._trig
+        lat2, cos_lat2, _ = other._trig
+        dlat = lat2 - lat1
+        dlng = math.radians(other.longitude - self.longitude)
+        a = math.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * math.sin(dlng / 2) ** 2
+        return 6371 * 2 * math.asin(math.sqrt(a))
+
+
+# Compiled once; validates a whole list of points in a single pydantic-core call
+_ROUTE_POINTS_TA = TypeAdapter(list[RoutePoint])
+
+
+def validate_route_points(raw: list[dict[str, Any]]) -> list[RoutePoint]:
+    """Validate raw route point dicts without building a full RouteSafetyRequest."""
+    return _ROUTE_POINTS_TA.validate_python(raw)
 
 
 class SafetyQueryRequest(BaseModel):
-    route_id: Optional[str] = Field(None, description="Optional route identifier")
+    route_id: str | None = Field(None, description="Optional route identifier")
     start_location: RoutePoint
     end_location: RoutePoint
-    waypoints: Optional[List[RoutePoint]] = Field(default=None, description="Intermediate stops")
-    travel_time: Optional[datetime] = Field(None, description="Planned travel time (for time-based safety)")
-    user_preference: SafetyPreference = Field(SafetyPreference.BALANCED, description="User safety preference")
+    waypoints: list[RoutePoint] | None = Field(default=None, description="Intermediate stops")
+    travel_time: datetime | None = Field(None, description="Planned travel time (for time-based safety)")
+    user_preference: _SafetyPreferenceLit = Field("balanced", description="User safety preference")
     check_radius_km: float = Field(1.0, ge=0.1, le=5.0, description="Radius to check for safety reports")
     
-    @field_validator('travel_time')
-    @classmethod
-    def validate_travel_time(cls, v):
-        if v and v < datetime.utcnow():
-            return datetime.utcnow()
-        return v
+    @model_validator(mode='after')
+    def _clamp_travel_time(self):
+        # Most queries omit travel_time, so only read the clock when there is one to clamp
+        if self.travel_time is not None:
+            now = datetime.utcnow()
+            if self.travel_time < now:
+                # object.__setattr__ skips validate_assignment-style re-validation
+                object.__setattr__(self, 'travel_time', now)
+        return self
 
 
 class RouteSafetyRequest(BaseModel):
-    route_data: Dict[str, Any] = Field(..., description="Route information (distance, duration, path)")
-    route_points: List[RoutePoint] = Field(..., description="Route coordinates")
-    travel_time: Optional[datetime] = None
-    user_id: Optional[str] = None
+    route_data: dict[str, Any] = Field(..., description="Route information (distance, duration, path)")
+    route_points: list[RoutePoint] = Field(..., description="Route coordinates")
+    travel_time: datetime | None = None
+    user_id: str | None = None
     check_community_reports: bool = Field(True, description="Include community safety reports")
     include_ai_analysis: bool = Field(True, description="Enable AI safety reasoning")
 
 
 class SafetyFactor(BaseModel):
+    model_config = _LEAF_CONFIG
+
     factor_name: str
-    score: int = Field(..., ge=0, le=100, description="Individual factor score")
-    weight: float = Field(..., ge=0.0, le=1.0, description="Factor importance weight")
+    score: _Score100 = Field(..., description="Individual factor score")
+    weight: _Ratio = Field(..., description="Factor importance weight")
     description: str
 
 
 class SafetyScoreResponse(BaseModel):
-    risk_score: int = Field(..., ge=0, le=100, description="Overall risk score (0=safe, 100=dangerous)")
+    risk_score: _Score100 = Field(..., description="Overall risk score (0=safe, 100=dangerous)")
     risk_label: RiskLevel
     report_count: int = Field(..., ge=0)
     avg_severity: float = Field(..., ge=0.0, le=5.0)
     is_night_time: bool
     time_context: str
     critical_reports: int = Field(..., ge=0)
-    dominant_categories: List[str]
+    dominant_categories: list[str]
     requires_warning: bool
     night_penalty_applied: int = Field(..., ge=0)
     clustering_detected: bool
-    safety_factors: Optional[List[SafetyFactor]] = None
+    safety_factors: list[SafetyFactor] | None = None
 
 
 class AIRiskAssessment(BaseModel):
-    safety_score: int = Field(..., ge=0, le=100)
-    risk_level: RiskLevel
-    risk_factors: List[str] = Field(default_factory=list)
-    positive_factors: List[str] = Field(default_factory=list)
+    safety_score: _Score100
+    risk_level: _RiskLevelLit
+    risk_factors: list[str] = Field(default_factory=list)
+    positive_factors: list[str] = Field(default_factory=list)
     night_safety_concern: bool
     recommended_action: str
     explanation: str
-    confidence: Optional[float] = Field(None, ge=0.0, le=1.0)
+    confidence: _Ratio | None = None
 
 
 class RouteSegmentSafety(BaseModel):
+    model_config = _LEAF_CONFIG
+
     segment_index: int
     latitude: float
     longitude: float
-    risk_score: int = Field(..., ge=0, le=100)
-    risk_label: RiskLevel
+    risk_score: _Score100
+    risk_label: _RiskLevelLit
     report_count: int
-    distance_from_start_km: Optional[float] = None
+    distance_from_start_km: float | None = None
 
 
 class RouteSafetyResponse(BaseModel):
-    route_id: Optional[str] = None
-    overall_risk_score: int = Field(..., ge=0, le=100)
-    risk_label: RiskLevel
-    avg_segment_risk: int
-    max_segment_risk: int
+    route_id: str | None = None
+    overall_risk_score: _Score100
+    risk_label: _RiskLevelLit
+    avg_segment_risk: _Score100
+    max_segment_risk: _Score100
     total_segments: int
-    risky_segments: List[int]
+    risky_segments: list[int]
     risky_segment_count: int
-    segment_details: List[RouteSegmentSafety]
-    ai_assessment: Optional[AIRiskAssessment] = None
+    segment_details: list[RouteSegmentSafety]
+    ai_assessment: AIRiskAssessment | None = None
     requires_alternative: bool = False
-    warning_message: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    warning_message: str | None = None
+    timestamp: str = Field(default_factory=_now_iso)
 
 
 class RouteComparisonRequest(BaseModel):
-    routes: List[Dict[str, Any]] = Field(..., min_length=2, description="Multiple routes to compare")
-    context: Dict[str, Any] = Field(default_factory=dict, description="User context and preferences")
-    travel_time: Optional[datetime] = None
+    routes: list[dict[str, Any]] = Field(..., min_length=2, description="Multiple routes to compare")
+    context: dict[str, Any] = Field(default_factory=dict, description="User context and preferences")
+    travel_time: datetime | None = None
 
 
 class RouteRanking(BaseModel):
     route_index: int
-    safety_score: int = Field(..., ge=0, le=100)
-    pros: List[str]
-    cons: List[str]
-    estimated_time_minutes: Optional[int] = None
-    distance_km: Optional[float] = None
+    safety_score: _Score100
+    pros: list[str]
+    cons: list[str]
+    estimated_time_minutes: int | None = None
+    distance_km: float | None = None
 
 
 class RouteComparisonResponse(BaseModel):
     recommended_route_index: int
     reasoning: str
-    route_rankings: List[RouteRanking]
+    route_rankings: list[RouteRanking]
     safety_tradeoff: str
-    user_warning: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    user_warning: str | None = None
+    timestamp: str = Field(default_factory=_now_iso)
 
 
 class RerouteCheckRequest(BaseModel):
-    current_route: Dict[str, Any]
-    new_reports: List[Dict[str, Any]]
+    current_route: dict[str, Any]
+    new_reports: list[dict[str, Any]]
     user_location: RoutePoint
     eta_remaining_minutes: int = Field(..., ge=0)
 
@@ -155,7 +221,7 @@ class RerouteDecision(BaseModel):
     affected_segment: str
     user_message: str
     alternative_action: str
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_now_iso)
 
 
 class SafetyZone(BaseModel):
@@ -163,15 +229,15 @@ class SafetyZone(BaseModel):
     center_latitude: float
     center_longitude: float
     radius_km: float
-    risk_level: RiskLevel
+    risk_level: _RiskLevelLit
     report_count: int
-    dominant_threat: Optional[str] = None
+    dominant_threat: str | None = None
     last_updated: str
 
 
 class SafetyHeatmapRequest(BaseModel):
-    center_latitude: float = Field(..., ge=-90, le=90)
-    center_longitude: float = Field(..., ge=-180, le=180)
+    center_latitude: _Lat
+    center_longitude: _Lng
     radius_km: float = Field(5.0, ge=1.0, le=20.0)
     grid_size_km: float = Field(0.5, ge=0.1, le=2.0)
     time_window_hours: int = Field(24, ge=1, le=168)
@@ -179,24 +245,18 @@ class SafetyHeatmapRequest(BaseModel):
 
 class SafetyHeatmapResponse(BaseModel):
     center: RoutePoint
-    zones: List[SafetyZone]
+    zones: list[SafetyZone]
     total_zones: int
     high_risk_zones: int
     safe_zones: int
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_now_iso)
 
 
 class SafetyAlertSubscription(BaseModel):
     user_id: str
-    subscribed_routes: List[str] = Field(default_factory=list)
+    subscribed_routes: list[str] = Field(default_factory=list)
     alert_threshold: RiskLevel = RiskLevel.RISKY
-    notification_preferences: Dict[str, bool] = Field(
-        default_factory=lambda: {
-            "email": True,
-            "push": True,
-            "sms": False
-        }
-    )
+    notification_preferences: dict[str, bool] = Field(default_factory=_default_notif_prefs)
 
 
 class SafetyAlert(BaseModel):
@@ -207,17 +267,17 @@ class SafetyAlert(BaseModel):
     affected_area: str
     recommended_action: str
     timestamp: str
-    expires_at: Optional[str] = None
+    expires_at: str | None = None
 
 
 class UserSafetyPreferences(BaseModel):
     user_id: str
     safety_priority: SafetyPreference = SafetyPreference.BALANCED
-    avoid_categories: List[str] = Field(
+    avoid_categories: list[str] = Field(
         default_factory=list,
         description="Categories to strongly avoid (e.g., 'poor_lighting', 'isolated_area')"
     )
-    max_acceptable_risk: int = Field(50, ge=0, le=100, description="Max risk score willing to accept")
+    max_acceptable_risk: _Score100 = Field(50, description="Max risk score willing to accept")
     night_mode_enabled: bool = Field(True, description="Extra caution during night hours")
     enable_ai_explanations: bool = Field(True, description="Show AI reasoning for route choices")
 
@@ -232,8 +292,8 @@ class SafetyInsightsResponse(BaseModel):
     area_summary: str
     total_reports: int
     trend: str = Field(..., description="improving|stable|worsening")
-    peak_risk_hours: List[int] = Field(default_factory=list, description="Hours of day with most incidents")
-    safest_hours: List[int] = Field(default_factory=list)
-    category_breakdown: Dict[str, int]
-    ai_recommendations: List[str]
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
\ No newline at end of file
+    peak_risk_hours: list[int] = Field(default_factory=list, description="Hours of day with most incidents")
+    safest_hours: list[int] = Field(default_factory=list)
+    category_breakdown: dict[str, int]
+    ai_recommendations: list[str]
+    timestamp: str = Field(default_factory=_now_iso)
\ No newline at end of file
@@ -1,67 +1,118 @@
-from typing import Dict, Any, Optional, List
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+from cachetools import TTLCache, cached
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Shared client; Nominatim holds no per-request state
+_geolocator = Nominatim(user_agent="safety_route_app")
+
+# Bounded caches so a long-running process does not grow without limit.
+# Failed lookups raise out of the cached helpers and are never stored.
+GEOCODE_CACHE_SIZE = 4096
+GEOCODE_CACHE_TTL_SECONDS = 3600
+# Reverse lookups are keyed on coordinates rounded to 4 places (~11 m)
+REVERSE_GEOCODE_PRECISION = 4
+# Lookups a batch keeps in flight at once, to stay polite to Nominatim
+MAX_CONCURRENT_LOOKUPS = 5
+
+# At most this many lookup-failure warnings per second; an upstream outage
+# otherwise floods the log handler from every worker thread at once
+LOOKUP_ERROR_LOGS_PER_SECOND = 10
+_recent_error_logs: deque = deque(maxlen=LOOKUP_ERROR_LOGS_PER_SECOND)
+
+
+def _log_lookup_error(operation: str, exc: Exception) -> None:
+    now = time.monotonic()
+    if len(_recent_error_logs) == _recent_error_logs.maxlen and now - _recent_error_logs[0] < 1.0:
+        return
+    _recent_error_logs.append(now)
+    logger.warning("%s error: %s", operation, exc)
+
+
+@cached(TTLCache(maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL_SECONDS), lock=threading.Lock())
+def _geocode_raw(address: str) -> Optional[Dict[str, Any]]:
+    location = _geolocator.geocode(address, timeout=10)
+    if location is None:
+        return None
+    return {
+        "address": location.address,
+        "latitude": location.latitude,
+        "longitude": location.longitude,
+        "raw": location.raw
+    }
+
+
+@cached(TTLCache(maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL_SECONDS), lock=threading.Lock())
+def _reverse_raw(lat_q: float, lng_q: float) -> Optional[Dict[str, Any]]:
+    location = _geolocator.reverse(f"{lat_q}, {lng_q}", timeout=10, language='en')
+    if location is None:
+        return None
+    return {
+        "address": location.address,
+        "components": location.raw.get('address', {})
+    }
+
 
 class GeocodingService:
     def __init__(self):
-        self.geolocator = Nominatim(user_agent="safety_route_app")
-        self.cache = {}
+        self.geolocator = _geolocator
     
     def geocode_address(self, address: str) -> Optional[Dict[str, Any]]:
         """Convert address to coordinates"""
-        if address in self.cache:
-            return self.cache[address]
-        
         try:
-            location = self.geolocator.geocode(address, timeout=10)
-            
-            if location:
-                result = {
-                    "address": location.address,
-                    "latitude": location.latitude,
-                    "longitude": location.longitude,
-                    "raw": location.raw
-                }
-                self.cache[address] = result
-                return result
-            
-            return None
+            return _geocode_raw(address)
         
         except (GeocoderTimedOut, GeocoderServiceError) as e:
-            print(f"Geocoding error: {e}")
+            _log_lookup_error("Geocoding", e)
             return None
     
     def reverse_geocode(self, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
         """Convert coordinates to address"""
-        cache_key = f"{latitude},{longitude}"
-        
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
         try:
-            location = self.geolocator.reverse(
-                f"{latitude}, {longitude}",
-                timeout=10,
-                language='en'
+            place = _reverse_raw(
+                round(latitude, REVERSE_GEOCODE_PRECISION),
+                round(longitude, REVERSE_GEOCODE_PRECISION)
             )
             
-            if location:
-                result = {
-                    "address": location.address,
+            if place:
+                return {
+                    "address": place["address"],
                     "latitude": latitude,
                     "longitude": longitude,
-                    "components": location.raw.get('address', {})
+                    "components": place["components"]
                 }
-                self.cache[cache_key] = result
-                return result
             
             return None
         
         except (GeocoderTimedOut, GeocoderServiceError) as e:
-            print(f"Reverse geocoding error: {e}")
+            _log_lookup_error("Reverse geocoding", e)
             return None
     
+    async def batch_reverse(
+        self,
+        points: Sequence[Tuple[float, float]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Reverse geocode many (lat, lng) points concurrently, in input order.
+        Each blocking lookup runs on a worker thread, at most
+        MAX_CONCURRENT_LOOKUPS at a time.
+        """
+        slots = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+        
+        async def reverse_one(latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+            async with slots:
+                return await asyncio.to_thread(self.reverse_geocode, latitude, longitude)
+        
+        return await asyncio.gather(*(reverse_one(lat, lng) for lat, lng in points))
+    
     def search_places(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Search for places"""
         try:
@@ -87,7 +138,7 @@ class GeocodingService:
             return results
         
         except (GeocoderTimedOut, GeocoderServiceError) as e:
-            print(f"Search error: {e}")
+            _log_lookup_error("Search", e)
             return []
 
 
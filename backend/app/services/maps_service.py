@@ -1,14 +1,30 @@
 import json
 import math
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, NamedTuple, Optional, Tuple
 import random
 
 
+# Haversine constants folded once: degrees->radians (and its half, for the
+# half-angle terms) and 2 * Earth's radius in km
+_DEG2RAD = math.pi / 180
+_HALF_DEG2RAD = _DEG2RAD / 2
+_EARTH_DIAMETER_KM = 2 * 6371
+
+
+class Waypoint(NamedTuple):
+    """A route coordinate; a tuple is far smaller than a {"lat", "lng"} dict."""
+    lat: float
+    lng: float
+
+
 class MapsService:
     """Service for route generation and map operations"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.mock_mode = True  # Set to False when using real API
+        # Own generator for mock jitter: reproducible with a seed, and not
+        # shared with (or reseeded by) other users of the global random module
+        self._rng = random.Random(seed)
     
     async def get_routes(
         self, 
@@ -41,15 +57,27 @@ class MapsService:
             source['lat'], source['lng'],
             destination['lat'], destination['lng']
         )
+        # Every mock route spans the same box, so build it once for all of them
+        bounds = {
+            "northeast": {
+                "lat": max(source['lat'], destination['lat']) + 0.001,
+                "lng": max(source['lng'], destination['lng']) + 0.001
+            },
+            "southwest": {
+                "lat": min(source['lat'], destination['lat']) - 0.001,
+                "lng": min(source['lng'], destination['lng']) - 0.001
+            }
+        }
         
         for i in range(num_routes):
             # Generate slightly different routes
-            distance_variation = random.uniform(0.9, 1.3)
+            distance_variation = self._rng.uniform(0.9, 1.3)
             distance = base_distance * distance_variation * 1000  # to meters
             duration = distance / 1.4 * 60  # walking speed ~1.4 m/s
             
-            # Generate waypoints for the route
-            waypoints = self._generate_waypoints(
+            # Generate waypoints for the route; scorers can read the parallel
+            # coordinate lists in "waypoints_soa" instead of walking the dicts
+            lats, lngs = self._generate_waypoint_arrays(
                 source, destination, points=8 + i * 2
             )
             
@@ -57,46 +85,43 @@ class MapsService:
                 "summary": f"Route {i + 1} via {'Main Road' if i == 0 else 'Alternative Path'}",
                 "distance": round(distance, 2),
                 "duration": round(duration, 2),
-                "polyline": self._encode_polyline(waypoints),
-                "waypoints": waypoints,
-                "bounds": {
-                    "northeast": {
-                        "lat": max(source['lat'], destination['lat']) + 0.001,
-                        "lng": max(source['lng'], destination['lng']) + 0.001
-                    },
-                    "southwest": {
-                        "lat": min(source['lat'], destination['lat']) - 0.001,
-                        "lng": min(source['lng'], destination['lng']) - 0.001
-                    }
-                }
+                "polyline": _encode_polyline5(zip(lats, lngs)),
+                "waypoints": list(map(Waypoint, lats, lngs)),
+                "waypoints_soa": (lats, lngs),
+                "bounds": bounds
             }
             routes.append(route)
         
         return routes
     
+    def _generate_waypoint_arrays(
+        self, 
+        source: Dict, 
+        destination: Dict, 
+        points: int = 10
+    ) -> Tuple[List[float], List[float]]:
+        """Generate waypoints between source and destination as parallel (lats, lngs) lists"""
+        src_lat, src_lng = source['lat'], source['lng']
+        dst_lat, dst_lng = destination['lat'], destination['lng']
+        # Linear interpolation step, computed once for the whole path
+        step_lat = (dst_lat - src_lat) / points
+        step_lng = (dst_lng - src_lng) / points
+        uniform = self._rng.uniform
+        
+        # Interior points get slight random variation to look more realistic
+        interior = range(1, points)
+        lats = [src_lat, *(src_lat + step_lat * i + uniform(-0.0005, 0.0005) for i in interior), dst_lat]
+        lngs = [src_lng, *(src_lng + step_lng * i + uniform(-0.0005, 0.0005) for i in interior), dst_lng]
+        return lats, lngs
+    
     def _generate_waypoints(
         self, 
         source: Dict, 
         destination: Dict, 
         points: int = 10
-    ) -> List[Dict]:
+    ) -> List[Waypoint]:
         """Generate intermediate waypoints between source and destination"""
-        waypoints = []
-        
-        for i in range(points + 1):
-            t = i / points
-            # Linear interpolation with slight random variation
-            lat = source['lat'] + (destination['lat'] - source['lat']) * t
-            lng = source['lng'] + (destination['lng'] - source['lng']) * t
-            
-            # Add some curve to make it look more realistic
-            if i > 0 and i < points:
-                lat += random.uniform(-0.0005, 0.0005)
-                lng += random.uniform(-0.0005, 0.0005)
-            
-            waypoints.append({"lat": lat, "lng": lng})
-        
-        return waypoints
+        return list(map(Waypoint, *self._generate_waypoint_arrays(source, destination, points)))
     
     def _calculate_distance(
         self, 
@@ -106,26 +131,67 @@ class MapsService:
         lng2: float
     ) -> float:
         """Calculate distance between two points in kilometers (Haversine formula)"""
-        R = 6371  # Earth's radius in km
-        
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lng = math.radians(lng2 - lng1)
+        lat1_rad = lat1 * _DEG2RAD
+        lat2_rad = lat2 * _DEG2RAD
+        half_dlat = (lat2 - lat1) * _HALF_DEG2RAD
+        half_dlng = (lng2 - lng1) * _HALF_DEG2RAD
         
-        a = (math.sin(delta_lat / 2) ** 2 +
+        a = (math.sin(half_dlat) ** 2 +
              math.cos(lat1_rad) * math.cos(lat2_rad) *
-             math.sin(delta_lng / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+             math.sin(half_dlng) ** 2)
         
-        return R * c
+        return _EARTH_DIAMETER_KM * math.asin(math.sqrt(a))
     
-    def _encode_polyline(self, waypoints: List[Dict]) -> str:
-        """Simple polyline encoding (mock version)"""
-        # For demo, just return a simple encoded string
-        return f"encoded_{len(waypoints)}_points"
+    def _encode_polyline(self, waypoints: List[Waypoint]) -> str:
+        """Encode waypoints in Google's polyline format (5 decimal places)"""
+        return _encode_polyline5(waypoints)
     
-    def decode_polyline(self, polyline: str) -> List[Dict]:
+    def decode_polyline(self, polyline: str) -> List[Waypoint]:
         """Decode polyline to list of coordinates"""
-        # Mock implementation
-        return []
\ No newline at end of file
+        return [Waypoint(lat, lng) for lat, lng in _decode_polyline5(polyline)]
+
+
+def _encode_value(value: int, out: List[str]) -> None:
+    """Append one signed delta as zigzag-encoded 5-bit chunks."""
+    value = ~(value << 1) if value < 0 else value << 1
+    while value >= 0x20:
+        out.append(chr((0x20 | (value & 0x1f)) + 63))
+        value >>= 5
+    out.append(chr(value + 63))
+
+
+def _encode_polyline5(coords: Iterable[Tuple[float, float]]) -> str:
+    """Google polyline algorithm: delta-encode E5 fixed-point lat/lng pairs."""
+    out: List[str] = []
+    prev_lat = prev_lng = 0
+    for lat, lng in coords:
+        lat_e5 = round(lat * 1e5)
+        lng_e5 = round(lng * 1e5)
+        _encode_value(lat_e5 - prev_lat, out)
+        _encode_value(lng_e5 - prev_lng, out)
+        prev_lat, prev_lng = lat_e5, lng_e5
+    return "".join(out)
+
+
+def _decode_polyline5(polyline: str) -> List[Tuple[float, float]]:
+    """Inverse of _encode_polyline5. Strings that are not polylines decode to []."""
+    coords: List[Tuple[float, float]] = []
+    values: List[int] = []
+    value = shift = 0
+    for char in polyline:
+        chunk = ord(char) - 63
+        if not 0 <= chunk < 64:
+            return []
+        value |= (chunk & 0x1f) << shift
+        shift += 5
+        if chunk < 0x20:
+            values.append(~(value >> 1) if value & 1 else value >> 1)
+            value = shift = 0
+    if shift or len(values) % 2:
+        return []
+    lat = lng = 0
+    for i in range(0, len(values), 2):
+        lat += values[i]
+        lng += values[i + 1]
+        coords.append((lat / 1e5, lng / 1e5))
+    return coords
\ No newline at end of file
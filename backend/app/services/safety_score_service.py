@@ -1,38 +1,203 @@
 import json
 import math
 import os
-from typing import List, Dict, Optional
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, NamedTuple, Optional, Sequence, Tuple
 from datetime import datetime
 
+from cachetools import LRUCache
+
+from app.services.maps_service import Waypoint
+
+
+# Side of a zone index cell in degrees (~1.1 km of latitude)
+ZONE_CELL_SIZE_DEG = 0.01
+KM_PER_DEG_LAT = 111.32
+
+_DEG2RAD = math.pi / 180
+_EARTH_DIAMETER_KM = 2 * 6371
+
+# A point or zone center prepared for repeated distance checks; radius_a is
+# the haversine term a at the zone's edge (0 for plain points)
+ZoneGeo = Tuple[float, float, float, float, float]  # (lat_rad, lng_rad, cos_lat, radius_km, radius_a)
+
+
+def _point_geo(lat: float, lng: float, radius_km: float = 0.0) -> ZoneGeo:
+    """Radians and cos(lat) for a point, computed once and reused for every pair."""
+    lat_rad = lat * _DEG2RAD
+    radius_a = math.sin(radius_km / _EARTH_DIAMETER_KM) ** 2
+    return lat_rad, lng * _DEG2RAD, math.cos(lat_rad), radius_km, radius_a
+
+
+def _haversine_a(p: ZoneGeo, q: ZoneGeo) -> float:
+    """The haversine term a between two prepared points (monotonic in distance)."""
+    return (math.sin((q[0] - p[0]) * 0.5) ** 2 +
+            p[2] * q[2] * math.sin((q[1] - p[1]) * 0.5) ** 2)
+
+
+def _haversine_km(p: ZoneGeo, q: ZoneGeo) -> float:
+    """Haversine distance in km between two prepared points."""
+    return _EARTH_DIAMETER_KM * math.asin(math.sqrt(_haversine_a(p, q)))
+
+
+def _within_radius(p: ZoneGeo, q: ZoneGeo) -> bool:
+    """Whether point p lies inside zone q, compared on a to skip sqrt and asin."""
+    return _haversine_a(p, q) < q[4]
+
+
+# Flat-earth distances are within a fraction of a percent at zone scales;
+# the margin keeps the cheap test from rejecting anything truly inside
+_PREFILTER_MARGIN = 1.05
+
+
+def _roughly_within(p: ZoneGeo, q: ZoneGeo) -> bool:
+    """
+    Equirectangular check that point p may lie inside zone q's radius.
+    Uses no trig, so callers run the exact haversine only for likely hits.
+    """
+    dy = q[0] - p[0]
+    dx = (q[1] - p[1]) * p[2]
+    reach = q[3] * _PREFILTER_MARGIN / 6371
+    return dx * dx + dy * dy < reach * reach
+
+
+# Safety multiplier per hour: night (22-5) 0.6, daytime (6-18) 1.0,
+# early evening (19-21) 0.85
+_TIME_FACTOR_BY_HOUR = (0.6,) * 6 + (1.0,) * 13 + (0.85,) * 3 + (0.6,) * 2
+
+# Crowd time period per hour, matching the keys of each area's time_pattern
+_TIME_PERIOD_BY_HOUR = (
+    ('night',) * 6 + ('morning',) * 6 + ('afternoon',) * 6 + ('evening',) * 4 + ('night',) * 2
+)
+
+
+# Crowd level -> safety score (moderate is best for safety)
+CROWD_SCORE_MAP = MappingProxyType({
+    'very_high': 60,  # Too crowded
+    'high': 75,       # Good
+    'medium': 80,     # Best
+    'low': 65,        # A bit isolated
+    'very_low': 45    # Too isolated
+})
+
+
+# Crime zone types as small ints; the crime types sort below poor lighting
+_ZONE_HIGH_CRIME, _ZONE_MEDIUM_CRIME, _ZONE_POOR_LIGHTING, _ZONE_OTHER = range(4)
+_ZONE_TYPE_ID = MappingProxyType({
+    'high_crime': _ZONE_HIGH_CRIME,
+    'medium_crime': _ZONE_MEDIUM_CRIME,
+    'poor_lighting': _ZONE_POOR_LIGHTING
+})
+
+# Crime score penalty per zone severity (unknown severities count as low)
+_SEVERITY_PENALTY = MappingProxyType({
+    'high': 50,
+    'medium': 25,
+    'low': 10
+})
+
+
+# Scores are a pure function of the waypoints and hour, so repeat queries for
+# the same route (e.g. "now" vs "later" views) are served from here
+SCORE_CACHE_SIZE = 1024
+_score_cache: LRUCache = LRUCache(maxsize=SCORE_CACHE_SIZE)
+_score_cache_lock = threading.Lock()
+
+
+class ZoneTable(NamedTuple):
+    """Zones from one data file with their prepared geometry and grid index"""
+    zones: Tuple[Dict, ...]
+    geo: Tuple[ZoneGeo, ...]  # parallel to zones
+    cell_index: Dict[Tuple[int, int], List[int]]
+
+
+@lru_cache(maxsize=None)
+def _load_zone_table(filename: str, list_key: str, center_key: str, label: str) -> ZoneTable:
+    """Read a zone data file once per process and prepare it for distance checks"""
+    try:
+        file_path = os.path.join(os.path.dirname(__file__), '../data', filename)
+        with open(file_path, 'r') as f:
+            zones = tuple(json.load(f).get(list_key, []))
+    except Exception as e:
+        print(f"Warning: Could not load {label}: {e}")
+        zones = ()
+    
+    # Centers in radians with cos(lat) and radius in km, so per-pair
+    # distance math skips the conversions
+    geo = tuple(
+        _point_geo(z[center_key]['lat'], z[center_key]['lng'], z['radius'] / 1000)
+        for z in zones
+    )
+    return ZoneTable(zones, geo, SafetyScoreService._build_zone_cell_index(zones, center_key))
+
 
 class SafetyScoreService:
     """Service for calculating route safety scores"""
     
     def __init__(self):
-        self.crime_zones = self._load_crime_zones()
-        self.crowd_data = self._load_crowd_data()
+        # Parsed and prepared once per process; every instance shares them
+        self.crime_zones, self._crime_zone_geo, self._cell_to_zones = _load_zone_table(
+            'mock_crime_zones.json', 'zones', 'center', 'crime zones'
+        )
+        # Zone type ids and severity penalties, parallel to crime_zones, so
+        # the scoring loops compare ints instead of strings
+        self._crime_zone_type_ids = tuple(
+            _ZONE_TYPE_ID.get(zone['type'], _ZONE_OTHER) for zone in self.crime_zones
+        )
+        self._crime_zone_penalties = tuple(
+            _SEVERITY_PENALTY.get(zone['severity'], 10) for zone in self.crime_zones
+        )
+        self.crowd_data, self._crowd_area_geo, self._cell_to_areas = _load_zone_table(
+            'mock_crowd_data.json', 'areas', 'location', 'crowd data'
+        )
+        # Time period -> each area's crowd score in that period, by area index
+        self._crowd_scores_by_period = {
+            period: tuple(
+                CROWD_SCORE_MAP.get(area['time_pattern'].get(period, 'medium'), 70)
+                for area in self.crowd_data
+            )
+            for period in set(_TIME_PERIOD_BY_HOUR)
+        }
     
-    def _load_crime_zones(self) -> List[Dict]:
-        """Load crime zones from JSON file"""
-        try:
-            file_path = os.path.join(os.path.dirname(__file__), '../data/mock_crime_zones.json')
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                return data.get('zones', [])
-        except Exception as e:
-            print(f"Warning: Could not load crime zones: {e}")
-            return []
+    @staticmethod
+    def _build_zone_cell_index(
+        zones: Sequence[Dict],
+        center_key: str
+    ) -> Dict[Tuple[int, int], List[int]]:
+        """
+        Map grid cells to the indexes of zones that may cover them.
+        
+        Each zone is registered in every cell touched by its bounding box,
+        padded by one cell, so a point lookup never misses a zone. Indexes
+        are appended in zone order, so each cell's list stays sorted.
+        """
+        cell_to_zones = defaultdict(list)
+        for zone_idx, zone in enumerate(zones):
+            lat = zone[center_key]['lat']
+            lng = zone[center_key]['lng']
+            radius_km = zone['radius'] / 1000
+            
+            lat_span = radius_km / KM_PER_DEG_LAT
+            lng_span = radius_km / (KM_PER_DEG_LAT * max(math.cos(math.radians(lat)), 0.01))
+            
+            min_row, min_col = SafetyScoreService._zone_cell(lat - lat_span, lng - lng_span)
+            max_row, max_col = SafetyScoreService._zone_cell(lat + lat_span, lng + lng_span)
+            for row in range(min_row - 1, max_row + 2):
+                for col in range(min_col - 1, max_col + 2):
+                    cell_to_zones[(row, col)].append(zone_idx)
+        
+        return dict(cell_to_zones)
     
-    def _load_crowd_data(self) -> List[Dict]:
-        """Load crowd data from JSON file"""
-        try:
-            file_path = os.path.join(os.path.dirname(__file__), '../data/mock_crowd_data.json')
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                return data.get('areas', [])
-        except Exception as e:
-            print(f"Warning: Could not load crowd data: {e}")
-            return []
+    @staticmethod
+    def _zone_cell(lat: float, lng: float) -> Tuple[int, int]:
+        """Grid cell containing a point"""
+        return (
+            math.floor(lat / ZONE_CELL_SIZE_DEG),
+            math.floor(lng / ZONE_CELL_SIZE_DEG)
+        )
     
     async def calculate_safety_score(
         self,
@@ -50,15 +215,25 @@ class SafetyScoreService:
         - crowd_score: 0-100
         - time_factor: 0-1 multiplier
         """
-        waypoints = route.get('waypoints', [])
+        lats, lngs = self._waypoint_arrays(route)
         
-        if not waypoints:
+        if not lats:
             return self._default_score()
         
+        # user_profile does not affect the score, so it is not part of the key
+        key = (tuple(lats), tuple(lngs), time_of_day)
+        with _score_cache_lock:
+            cached = _score_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        
+        geos = list(map(_point_geo, lats, lngs))
+        cells = list(map(self._zone_cell, lats, lngs))
+        
         # Calculate individual scores
-        crime_score = self._calculate_crime_score(waypoints)
-        lighting_score = self._calculate_lighting_score(waypoints, time_of_day)
-        crowd_score = self._calculate_crowd_score(waypoints, time_of_day)
+        crime_score = self._calculate_crime_score(geos, cells)
+        lighting_score = self._calculate_lighting_score(geos, cells, time_of_day)
+        crowd_score = self._calculate_crowd_score(geos, cells, time_of_day)
         
         # Time factor (night is less safe)
         time_factor = self._get_time_factor(time_of_day)
@@ -70,15 +245,37 @@ class SafetyScoreService:
             crowd_score * 0.3         # Crowd density (30%)
         ) * time_factor
         
-        return {
+        score = {
             "overall_score": round(overall_score, 2),
             "crime_score": round(crime_score, 2),
             "lighting_score": round(lighting_score, 2),
             "crowd_score": round(crowd_score, 2),
             "time_factor": round(time_factor, 2)
         }
+        with _score_cache_lock:
+            _score_cache[key] = score
+        return dict(score)
     
-    def _calculate_crime_score(self, waypoints: List[Dict]) -> float:
+    def _waypoint_arrays(self, route: Dict) -> Tuple[Sequence[float], Sequence[float]]:
+        """
+        Route waypoints as parallel (lats, lngs) sequences.
+        Reads the route's waypoints_soa when present.
+        """
+        soa = route.get('waypoints_soa')
+        if soa is not None:
+            return soa
+        waypoints = route.get('waypoints', [])
+        return [point.lat for point in waypoints], [point.lng for point in waypoints]
+    
+    def _prepare_waypoints(self, route: Dict) -> Tuple[List[ZoneGeo], List[Tuple[int, int]]]:
+        """
+        Prepared geometry and grid cell of every route waypoint, as parallel
+        lists, computed once and shared by all the zone scans for the route.
+        """
+        lats, lngs = self._waypoint_arrays(route)
+        return list(map(_point_geo, lats, lngs)), list(map(self._zone_cell, lats, lngs))
+    
+    def _calculate_crime_score(self, geos: List[ZoneGeo], cells: List[Tuple[int, int]]) -> float:
         """
         Calculate crime safety score based on proximity to crime zones.
         Returns 0-100 (100 = safest)
@@ -88,38 +285,41 @@ class SafetyScoreService:
         
         total_danger = 0
         danger_points = 0
+        type_ids = self._crime_zone_type_ids
+        penalties = self._crime_zone_penalties
         
-        for point in waypoints:
-            for zone in self.crime_zones:
-                if zone['type'] in ['high_crime', 'medium_crime']:
-                    distance = self._calculate_distance(
-                        point['lat'], point['lng'],
-                        zone['center']['lat'], zone['center']['lng']
-                    )
+        for point_geo, cell in zip(geos, cells):
+            # Only zones indexed under the point's cell can contain it
+            for zone_idx in self._cell_to_zones.get(cell, ()):
+                zone_geo = self._crime_zone_geo[zone_idx]
+                # Check if point is within danger zone
+                if (type_ids[zone_idx] < _ZONE_POOR_LIGHTING
+                        and _roughly_within(point_geo, zone_geo)
+                        and _within_radius(point_geo, zone_geo)):
+                    distance = _haversine_km(point_geo, zone_geo)
+                    radius_km = zone_geo[3]
+                    severity_penalty = penalties[zone_idx]
                     
-                    # Check if point is within danger zone
-                    if distance < zone['radius'] / 1000:  # radius in meters, distance in km
-                        severity_penalty = {
-                            'high': 50,
-                            'medium': 25,
-                            'low': 10
-                        }.get(zone['severity'], 10)
-                        
-                        # Closer = more dangerous
-                        proximity_factor = 1 - (distance / (zone['radius'] / 1000))
-                        total_danger += severity_penalty * proximity_factor
-                        danger_points += 1
+                    # Closer = more dangerous
+                    proximity_factor = 1 - (distance / radius_km)
+                    total_danger += severity_penalty * proximity_factor
+                    danger_points += 1
         
         if danger_points == 0:
             return 95.0  # No crime zones nearby
         
         # Convert danger to safety score
-        avg_danger = total_danger / len(waypoints)
+        avg_danger = total_danger / len(geos)
         safety_score = max(0, 100 - avg_danger)
         
         return safety_score
     
-    def _calculate_lighting_score(self, waypoints: List[Dict], time_of_day: int) -> float:
+    def _calculate_lighting_score(
+        self,
+        geos: List[ZoneGeo],
+        cells: List[Tuple[int, int]],
+        time_of_day: int
+    ) -> float:
         """
         Calculate lighting safety score.
         Returns 0-100 (100 = well lit)
@@ -131,29 +331,33 @@ class SafetyScoreService:
         # Night time - check for poorly lit zones
         total_darkness = 0
         dark_points = 0
+        type_ids = self._crime_zone_type_ids
         
-        for point in waypoints:
-            for zone in self.crime_zones:
-                if zone['type'] == 'poor_lighting':
-                    distance = self._calculate_distance(
-                        point['lat'], point['lng'],
-                        zone['center']['lat'], zone['center']['lng']
-                    )
-                    
-                    if distance < zone['radius'] / 1000:
-                        proximity_factor = 1 - (distance / (zone['radius'] / 1000))
-                        total_darkness += 40 * proximity_factor
-                        dark_points += 1
+        for point_geo, cell in zip(geos, cells):
+            for zone_idx in self._cell_to_zones.get(cell, ()):
+                zone_geo = self._crime_zone_geo[zone_idx]
+                if (type_ids[zone_idx] == _ZONE_POOR_LIGHTING
+                        and _roughly_within(point_geo, zone_geo)
+                        and _within_radius(point_geo, zone_geo)):
+                    distance = _haversine_km(point_geo, zone_geo)
+                    proximity_factor = 1 - (distance / zone_geo[3])
+                    total_darkness += 40 * proximity_factor
+                    dark_points += 1
         
         if dark_points == 0:
             return 80.0  # Assume moderate lighting at night
         
-        avg_darkness = total_darkness / len(waypoints)
+        avg_darkness = total_darkness / len(geos)
         lighting_score = max(20, 100 - avg_darkness)
         
         return lighting_score
     
-    def _calculate_crowd_score(self, waypoints: List[Dict], time_of_day: int) -> float:
+    def _calculate_crowd_score(
+        self,
+        geos: List[ZoneGeo],
+        cells: List[Tuple[int, int]],
+        time_of_day: int
+    ) -> float:
         """
         Calculate crowd density score.
         Returns 0-100 (moderate crowd = safest ~70-80)
@@ -162,28 +366,14 @@ class SafetyScoreService:
             return 70.0  # Default moderate crowd
         
         crowd_levels = []
+        # Score of every area at this hour's crowd level, looked up once per call
+        area_scores = self._crowd_scores_by_period[self._get_time_period(time_of_day)]
         
-        for point in waypoints:
-            for area in self.crowd_data:
-                distance = self._calculate_distance(
-                    point['lat'], point['lng'],
-                    area['location']['lat'], area['location']['lng']
-                )
-                
-                if distance < area['radius'] / 1000:
-                    # Get crowd level for time of day
-                    time_period = self._get_time_period(time_of_day)
-                    crowd_level = area['time_pattern'].get(time_period, 'medium')
-                    
-                    # Convert to score (moderate is best for safety)
-                    crowd_score_map = {
-                        'very_high': 60,  # Too crowded
-                        'high': 75,       # Good
-                        'medium': 80,     # Best
-                        'low': 65,        # A bit isolated
-                        'very_low': 45    # Too isolated
-                    }
-                    crowd_levels.append(crowd_score_map.get(crowd_level, 70))
+        for point_geo, cell in zip(geos, cells):
+            for area_idx in self._cell_to_areas.get(cell, ()):
+                area_geo = self._crowd_area_geo[area_idx]
+                if _roughly_within(point_geo, area_geo) and _within_radius(point_geo, area_geo):
+                    crowd_levels.append(area_scores[area_idx])
         
         if not crowd_levels:
             return 70.0
@@ -195,106 +385,83 @@ class SafetyScoreService:
         Get time-based safety multiplier.
         Returns 0-1 (1 = safest time)
         """
-        if 6 <= time_of_day <= 18:
-            return 1.0  # Daytime - safest
-        elif 19 <= time_of_day <= 21:
-            return 0.85  # Early evening - pretty safe
-        elif 22 <= time_of_day <= 23 or 0 <= time_of_day <= 5:
-            return 0.6  # Night - less safe
-        else:
-            return 0.7
+        if 0 <= time_of_day < 24:
+            return _TIME_FACTOR_BY_HOUR[time_of_day]
+        return 0.7
     
     def _get_time_period(self, time_of_day: int) -> str:
         """Convert hour to time period"""
-        if 6 <= time_of_day <= 11:
-            return 'morning'
-        elif 12 <= time_of_day <= 17:
-            return 'afternoon'
-        elif 18 <= time_of_day <= 21:
-            return 'evening'
-        else:
-            return 'night'
+        if 0 <= time_of_day < 24:
+            return _TIME_PERIOD_BY_HOUR[time_of_day]
+        return 'night'
     
     async def get_unsafe_zones(self, route: Dict) -> List[Dict]:
         """
         Get list of unsafe zones along the route.
         """
-        waypoints = route.get('waypoints', [])
+        geos, cells = self._prepare_waypoints(route)
         unsafe_zones = []
+        seen_zone_ids = set()
+        start_geo = geos[0] if geos else None
         
-        for point in waypoints:
-            for zone in self.crime_zones:
-                distance = self._calculate_distance(
-                    point['lat'], point['lng'],
-                    zone['center']['lat'], zone['center']['lng']
-                )
-                
-                if distance < zone['radius'] / 1000:
+        for point_geo, cell in zip(geos, cells):
+            for zone_idx in self._cell_to_zones.get(cell, ()):
+                zone = self.crime_zones[zone_idx]
+                zone_geo = self._crime_zone_geo[zone_idx]
+                # Each zone is reported once, at the first waypoint inside it
+                if zone['id'] in seen_zone_ids:
+                    continue
+                if _roughly_within(point_geo, zone_geo) and _within_radius(point_geo, zone_geo):
+                    seen_zone_ids.add(zone['id'])
+                    
                     # Calculate distance from route start
-                    distance_from_start = self._calculate_distance(
-                        waypoints[0]['lat'], waypoints[0]['lng'],
-                        point['lat'], point['lng']
-                    ) * 1000  # to meters
+                    distance_from_start = _haversine_km(start_geo, point_geo) * 1000  # to meters
                     
-                    unsafe_zone = {
+                    unsafe_zones.append({
                         "zone_id": zone['id'],
                         "type": zone['type'],
                         "severity": zone['severity'],
                         "location": zone['center'],
                         "description": zone['description'],
                         "distance_from_start": round(distance_from_start, 2)
-                    }
-                    
-                    # Avoid duplicates
-                    if not any(uz['zone_id'] == zone['id'] for uz in unsafe_zones):
-                        unsafe_zones.append(unsafe_zone)
+                    })
         
         return unsafe_zones
     
-    async def check_segment_safety(self, point1: Dict, point2: Dict) -> List[str]:
+    async def check_segment_safety(self, point1: Waypoint, point2: Waypoint) -> List[str]:
         """
         Check safety of a route segment.
         Returns list of warning messages.
         """
         warnings = []
         
+        # Only zones indexed under either endpoint's cell can contain it
+        candidates = set(self._cell_to_zones.get(self._zone_cell(point1.lat, point1.lng), ()))
+        candidates.update(self._cell_to_zones.get(self._zone_cell(point2.lat, point2.lng), ()))
+        
+        point1_geo = _point_geo(point1.lat, point1.lng)
+        point2_geo = _point_geo(point2.lat, point2.lng)
+        
         # Check if segment passes through unsafe zones
-        for zone in self.crime_zones:
-            # Check both endpoints
-            dist1 = self._calculate_distance(
-                point1['lat'], point1['lng'],
-                zone['center']['lat'], zone['center']['lng']
-            )
-            dist2 = self._calculate_distance(
-                point2['lat'], point2['lng'],
-                zone['center']['lat'], zone['center']['lng']
-            )
-            
-            threshold = zone['radius'] / 1000
-            
-            if dist1 < threshold or dist2 < threshold:
-                if zone['severity'] == 'high':
+        for zone_idx in sorted(candidates):
+            zone = self.crime_zones[zone_idx]
+            severity = zone['severity']
+            # Only high and medium zones produce warnings; skip the rest unmeasured
+            if severity != 'high' and severity != 'medium':
+                continue
+            zone_geo = self._crime_zone_geo[zone_idx]
+            # Check both endpoints; the second only if the first is outside
+            if _within_radius(point1_geo, zone_geo) or _within_radius(point2_geo, zone_geo):
+                if severity == 'high':
                     warnings.append(f"⚠️ HIGH RISK: {zone['description']}")
-                elif zone['severity'] == 'medium':
+                else:
                     warnings.append(f"⚡ CAUTION: {zone['description']}")
         
         return warnings
     
     def _calculate_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """Calculate distance between two points in kilometers"""
-        R = 6371  # Earth's radius in km
-        
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lng = math.radians(lng2 - lng1)
-        
-        a = (math.sin(delta_lat / 2) ** 2 +
-             math.cos(lat1_rad) * math.cos(lat2_rad) *
-             math.sin(delta_lng / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
-        return R * c
+        return _haversine_km(_point_geo(lat1, lng1), _point_geo(lat2, lng2))
     
     def _default_score(self) -> Dict:
         """Return default safety score"""
@@ -304,4 +471,8 @@ class SafetyScoreService:
             "lighting_score": 75.0,
             "crowd_score": 70.0,
             "time_factor": 1.0
-        }
\ No newline at end of file
+        }
+
+
+# Singleton instance; read-only after construction, so safe to share
+safety_score_service = SafetyScoreService()
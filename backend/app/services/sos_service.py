@@ -4,37 +4,54 @@ Emergency SOS service for Safety Route backend.
 Handles emergency trigger logic and notification preparation.
 """
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 
+from app.core.logger import get_logger
 
-def trigger_sos(
+logger = get_logger(__name__)
+
+
+async def trigger_sos(
     user_id: str,
     latitude: float,
     longitude: float,
     timestamp: Optional[str] = None,
     trusted_contacts: Optional[List[str]] = None
 ) -> Dict[str, Any]:
+    # Stamped once, up front, so the failure response reuses it
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc).isoformat()
+    
     try:
-        if timestamp is None:
-            timestamp = datetime.utcnow().isoformat() + "Z"
-        
         if trusted_contacts is None or len(trusted_contacts) == 0:
             trusted_contacts = [
                 "emergency_contact_1@example.com",
                 "emergency_contact_2@example.com"
             ]
         
+        # Notify every contact concurrently; one failed delivery must not
+        # hold up or cancel the others
+        results = await asyncio.gather(
+            *(
+                _simulate_notification(
+                    contact=contact,
+                    user_id=user_id,
+                    latitude=latitude,
+                    longitude=longitude,
+                    timestamp=timestamp
+                )
+                for contact in trusted_contacts
+            ),
+            return_exceptions=True
+        )
         notified_contacts = []
-        for contact in trusted_contacts:
-            _simulate_notification(
-                contact=contact,
-                user_id=user_id,
-                latitude=latitude,
-                longitude=longitude,
-                timestamp=timestamp
-            )
-            notified_contacts.append(contact)
+        for contact, result in zip(trusted_contacts, results):
+            if isinstance(result, Exception):
+                logger.warning("[SOS] Could not notify %s: %s", contact, result)
+            else:
+                notified_contacts.append(contact)
         
         response = {
             "status": "sent",
@@ -47,13 +64,13 @@ def trigger_sos(
             "timestamp": timestamp
         }
         
-        print(f"[SOS] Emergency alert triggered for user {user_id} at ({latitude}, {longitude})")
-        print(f"[SOS] Notified {len(notified_contacts)} contacts: {', '.join(notified_contacts)}")
+        logger.info("[SOS] Emergency alert triggered for user %s at (%s, %s)", user_id, latitude, longitude)
+        logger.info("[SOS] Notified %d contacts: %s", len(notified_contacts), ", ".join(notified_contacts))
         
         return response
     
     except Exception as e:
-        print(f"[SOS ERROR] Failed to trigger SOS: {str(e)}")
+        logger.error("[SOS ERROR] Failed to trigger SOS: %s", e)
         return {
             "status": "failed",
             "user_id": user_id,
@@ -62,12 +79,12 @@ def trigger_sos(
                 "longitude": longitude
             },
             "notified_contacts": [],
-            "timestamp": timestamp or datetime.utcnow().isoformat() + "Z",
+            "timestamp": timestamp,
             "error": str(e)
         }
 
 
-def _simulate_notification(
+async def _simulate_notification(
     contact: str,
     user_id: str,
     latitude: float,
@@ -84,5 +101,4 @@ def _simulate_notification(
     This is an automated emergency notification from Safety Route.
     """
     
-    print(f"[SOS NOTIFICATION] Sending to {contact}:")
-    print(message.strip())
\ No newline at end of file
+    logger.info("[SOS NOTIFICATION] Sending to %s:\n%s", contact, message.strip())
\ No newline at end of file
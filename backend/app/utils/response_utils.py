@@ -1,3 +1,19 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, much faster on float-heavy payloads."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
 def success_response(data, message="Success"):
     return {
         "success": True,
@@ -10,4 +26,4 @@ def error_response(message, status_code=500):
         "success": False,
         "message": message,
         "error_code": status_code
-    }
\ No newline at end of file
+    }
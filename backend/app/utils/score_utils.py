@@ -7,12 +7,25 @@ interpreting safety scores throughout the Safety Route system.
 Key Functions:
 - normalize_score: Ensure scores stay within 0-100 range
 - calculate_weighted_score: Combine multiple scores with weights
+- calculate_weighted_scores: Batch form for whole routes
+- score_segments: Weighted, time-adjusted scores for route segments
 - get_risk_level: Convert numeric score to risk category
+- get_risk_level_idx: Risk band index, for the band lookup tables
+- get_risk_level_batch / get_risk_color_batch: Per-segment labels and colors
 - interpolate_score: Calculate score between two values
+- interpolate_scores: Batch interpolation along a route
 - aggregate_scores: Combine multiple route scores
 """
 
-from typing import List, Dict, Tuple
+from bisect import bisect_right
+from typing import Callable, Iterable, List, Dict, Sequence, Tuple
+from app.constants.risk_labels import (
+    RISK_LEVEL_SAFE,
+    RISK_LEVEL_MODERATE,
+    RISK_LEVEL_RISKY,
+    RISK_LEVEL_DANGEROUS
+)
+from app.utils.time_utils import get_safety_multiplier_batch
 from app.constants.safety_thresholds import (
     CRIME_WEIGHT,
     LIGHTING_WEIGHT,
@@ -56,58 +69,154 @@ def normalize_score(score: float, min_val: float = 0.0, max_val: float = 100.0)
         >>> penalty = 30  # Heavy crime penalty
         >>> result = normalize_score(base_score - penalty)  # 50
     """
-    return max(min_val, min(max_val, score))
+    # Same result as max(min_val, min(max_val, score)), NaN included, but
+    # plain comparisons avoid two builtin calls per clamp
+    if not score < max_val:
+        return max_val
+    if score > min_val:
+        return score
+    return min_val
 
 
-def calculate_weighted_score(crime_score: float, 
-                            lighting_score: float, 
-                            crowd_score: float) -> float:
+def _make_weighted_score(crime_weight: float,
+                         lighting_weight: float,
+                         crowd_weight: float) -> Callable[[float, float, float], float]:
+    """
+    Build calculate_weighted_score with its factor weights bound as closure
+    variables, so each call reads them as cells instead of module globals.
     """
-    Calculate overall safety score using weighted combination of factors.
+    def calculate_weighted_score(crime_score: float,
+                                 lighting_score: float,
+                                 crowd_score: float) -> float:
+        """
+        Calculate overall safety score using weighted combination of factors.
+        
+        The overall safety score is not a simple average - different factors
+        have different importance levels:
+        - Crime: 40% (most important - directly affects personal safety)
+        - Lighting: 30% (visibility and deterrent for crime)
+        - Crowd: 30% (safety in numbers, but not overcrowding)
+        
+        Formula:
+        Overall = (Crime × 0.4) + (Lighting × 0.3) + (Crowd × 0.3)
+        
+        Why weighted?
+        A route through a high-crime area with good lighting is still dangerous.
+        Crime factor gets highest weight because it's the primary safety concern.
+        
+        Args:
+            crime_score (float): Crime safety score (0-100, higher = safer)
+            lighting_score (float): Lighting quality score (0-100, higher = better lit)
+            crowd_score (float): Crowd density score (0-100, optimal around 70-80)
+        
+        Returns:
+            float: Weighted overall safety score (0-100)
+        
+        Example:
+            >>> # Safe route: low crime, well lit, good crowd
+            >>> calculate_weighted_score(90, 85, 75)
+            83.5
+        
+            >>> # Dangerous route: high crime, poor lighting, isolated
+            >>> calculate_weighted_score(30, 40, 35)
+            35.0
+        
+            >>> # Mixed: safe from crime but poor lighting at night
+            >>> calculate_weighted_score(85, 35, 70)
+            66.5  # Crime weight keeps it moderate despite poor lighting
+        """
+        # Apply weights (bound from the constants when the module loads)
+        weighted = (
+            crime_score * crime_weight +        # 40% weight
+            lighting_score * lighting_weight +  # 30% weight
+            crowd_score * crowd_weight          # 30% weight
+        )
+        
+        # Ensure result is within valid range (normalize_score, inlined)
+        return max(0.0, min(100.0, weighted))
     
-    The overall safety score is not a simple average - different factors
-    have different importance levels:
-    - Crime: 40% (most important - directly affects personal safety)
-    - Lighting: 30% (visibility and deterrent for crime)
-    - Crowd: 30% (safety in numbers, but not overcrowding)
+    return calculate_weighted_score
+
+
+calculate_weighted_score = _make_weighted_score(CRIME_WEIGHT, LIGHTING_WEIGHT, CROWD_WEIGHT)
+
+
+def calculate_weighted_scores(crime_scores: Sequence[float],
+                              lighting_scores: Sequence[float],
+                              crowd_scores: Sequence[float]) -> List[float]:
+    """
+    Batch form of calculate_weighted_score over parallel per-segment score lists.
     
-    Formula:
-    Overall = (Crime × 0.4) + (Lighting × 0.3) + (Crowd × 0.3)
+    Example:
+        >>> calculate_weighted_scores([90, 30], [85, 40], [75, 35])
+        [84.0, 34.5]
+    """
+    crime_w, lighting_w, crowd_w = CRIME_WEIGHT, LIGHTING_WEIGHT, CROWD_WEIGHT
+    return [
+        max(0.0, min(100.0, c * crime_w + l * lighting_w + cr * crowd_w))
+        for c, l, cr in zip(crime_scores, lighting_scores, crowd_scores)
+    ]
+
+
+def score_segments(crime_scores: Sequence[float],
+                   lighting_scores: Sequence[float],
+                   crowd_scores: Sequence[float],
+                   hours: Sequence[int]) -> List[float]:
+    """
+    Final time-adjusted score for each route segment in a single pass.
     
-    Why weighted?
-    A route through a high-crime area with good lighting is still dangerous.
-    Crime factor gets highest weight because it's the primary safety concern.
+    Equivalent to calculate_weighted_score(...) * get_safety_multiplier(hour)
+    per segment, without the intermediate list of weighted scores.
     
-    Args:
-        crime_score (float): Crime safety score (0-100, higher = safer)
-        lighting_score (float): Lighting quality score (0-100, higher = better lit)
-        crowd_score (float): Crowd density score (0-100, optimal around 70-80)
+    Example:
+        >>> score_segments([90, 90], [85, 85], [75, 75], [14, 23])
+        [84.0, 50.4]
+    """
+    crime_w, lighting_w, crowd_w = CRIME_WEIGHT, LIGHTING_WEIGHT, CROWD_WEIGHT
+    return [
+        max(0.0, min(100.0, c * crime_w + l * lighting_w + cr * crowd_w)) * multiplier
+        for c, l, cr, multiplier in zip(
+            crime_scores, lighting_scores, crowd_scores, get_safety_multiplier_batch(hours)
+        )
+    ]
+
+
+# Lower score bounds of the risky (40+), moderate (50+) and safe (70+) bands,
+# and the level for each band in ascending order; bisect_right places a
+# score in its band
+_RISK_THRESHOLDS = (CRITICAL_RISK_THRESHOLD, MINIMUM_SAFE_SCORE, RECOMMENDED_SAFE_SCORE)
+RISK_LEVELS_BY_BAND = (
+    RISK_LEVEL_DANGEROUS,
+    RISK_LEVEL_RISKY,
+    RISK_LEVEL_MODERATE,
+    RISK_LEVEL_SAFE
+)
+# Display color for each band, aligned with RISK_LEVELS_BY_BAND
+RISK_COLORS_BY_BAND = (
+    "#FF4444",  # Red (dangerous)
+    "#FF8800",  # Orange (risky)
+    "#FFB700",  # Yellow (moderate)
+    "#00C851"   # Green (safe)
+)
+
+
+def get_risk_level_idx(score: float) -> int:
+    """
+    Risk band index of a score: 0 dangerous, 1 risky, 2 moderate, 3 safe.
     
-    Returns:
-        float: Weighted overall safety score (0-100)
+    Indexes RISK_LEVELS_BY_BAND and RISK_COLORS_BY_BAND, so callers that
+    need several attributes of one score can skip the level string.
     
     Example:
-        >>> # Safe route: low crime, well lit, good crowd
-        >>> calculate_weighted_score(90, 85, 75)
-        83.5
-        
-        >>> # Dangerous route: high crime, poor lighting, isolated
-        >>> calculate_weighted_score(30, 40, 35)
-        35.0
-        
-        >>> # Mixed: safe from crime but poor lighting at night
-        >>> calculate_weighted_score(85, 35, 70)
-        66.5  # Crime weight keeps it moderate despite poor lighting
+        >>> idx = get_risk_level_idx(55)
+        >>> RISK_LEVELS_BY_BAND[idx], RISK_COLORS_BY_BAND[idx]
+        ('moderate', '#FFB700')
     """
-    # Apply weights from constants
-    weighted = (
-        crime_score * CRIME_WEIGHT +      # 40% weight
-        lighting_score * LIGHTING_WEIGHT +  # 30% weight
-        crowd_score * CROWD_WEIGHT          # 30% weight
-    )
-    
-    # Ensure result is within valid range
-    return normalize_score(weighted)
+    # NaN compares false to every bound, which bisect would place in the
+    # safe band; an unknown score must not pass as safe
+    if score != score:
+        return 0
+    return bisect_right(_RISK_THRESHOLDS, score)
 
 
 def get_risk_level(score: float) -> str:
@@ -146,14 +255,7 @@ def get_risk_level(score: float) -> str:
         >>> print(f"Route safety: {level} ({color[level]})")
         Route safety: moderate (yellow)
     """
-    if score >= RECOMMENDED_SAFE_SCORE:  # 70+
-        return "safe"
-    elif score >= MINIMUM_SAFE_SCORE:    # 50-69
-        return "moderate"
-    elif score >= CRITICAL_RISK_THRESHOLD:  # 40-49
-        return "risky"
-    else:  # Below 40
-        return "dangerous"
+    return RISK_LEVELS_BY_BAND[get_risk_level_idx(score)]
 
 
 def get_risk_color(score: float) -> str:
@@ -182,14 +284,32 @@ def get_risk_color(score: float) -> str:
         >>> get_risk_color(25)
         '#FF4444'  # Red
     """
-    risk_level = get_risk_level(score)
-    color_map = {
-        "safe": "#00C851",      # Green
-        "moderate": "#FFB700",  # Yellow
-        "risky": "#FF8800",     # Orange
-        "dangerous": "#FF4444"  # Red
-    }
-    return color_map.get(risk_level, "#999999")  # Gray as fallback
+    # Same band lookup as get_risk_level, without the level string in between
+    return RISK_COLORS_BY_BAND[get_risk_level_idx(score)]
+
+
+def get_risk_level_batch(scores: Iterable[float]) -> List[str]:
+    """
+    Batch form of get_risk_level, e.g. for labeling every segment of a route.
+    
+    Example:
+        >>> get_risk_level_batch([85, 55, 45, 25])
+        ['safe', 'moderate', 'risky', 'dangerous']
+    """
+    levels, band = RISK_LEVELS_BY_BAND, get_risk_level_idx
+    return [levels[band(score)] for score in scores]
+
+
+def get_risk_color_batch(scores: Iterable[float]) -> List[str]:
+    """
+    Batch form of get_risk_color, e.g. for coloring every segment of a route.
+    
+    Example:
+        >>> get_risk_color_batch([85, 25])
+        ['#00C851', '#FF4444']
+    """
+    colors, band = RISK_COLORS_BY_BAND, get_risk_level_idx
+    return [colors[band(score)] for score in scores]
 
 
 def interpolate_score(start_score: float, end_score: float, factor: float) -> float:
@@ -230,6 +350,21 @@ def interpolate_score(start_score: float, end_score: float, factor: float) -> fl
     return start_score + (end_score - start_score) * factor
 
 
+def interpolate_scores(start_score: float, end_score: float, factors: Iterable[float]) -> List[float]:
+    """
+    Interpolate between two scores at many factors in one call.
+    
+    Preferred over calling interpolate_score in a loop along a route:
+    the score delta is computed once for all positions.
+    
+    Example:
+        >>> interpolate_scores(80, 40, [0.0, 0.25, 0.5, 1.0])
+        [80.0, 70.0, 60.0, 40.0]
+    """
+    delta = end_score - start_score
+    return [start_score + delta * factor for factor in factors]
+
+
 def aggregate_scores(scores: List[float], method: str = "average") -> float:
     """
     Combine multiple safety scores into a single aggregate score.
@@ -266,25 +401,39 @@ def aggregate_scores(scores: List[float], method: str = "average") -> float:
     if not scores:
         return 0.0
     
-    if method == "average":
-        return sum(scores) / len(scores)
-    
-    elif method == "min":
-        # Conservative: route is only as safe as its least safe segment
-        return min(scores)
-    
-    elif method == "weighted_avg":
-        # Weight lower scores more heavily (safety-first approach)
-        # Sort scores and give more weight to lower ones
-        sorted_scores = sorted(scores)
-        weights = [1.5 if i < len(scores) / 2 else 1.0 for i in range(len(scores))]
-        weighted_sum = sum(s * w for s, w in zip(sorted_scores, weights))
-        total_weight = sum(weights)
-        return weighted_sum / total_weight
-    
-    else:
-        # Default to average
-        return sum(scores) / len(scores)
+    # Unknown methods default to average
+    return _AGGREGATORS.get(method, _average_score)(scores)
+
+
+def _average_score(scores: List[float]) -> float:
+    """Simple mean of all scores."""
+    return sum(scores) / len(scores)
+
+
+def _min_score(scores: List[float]) -> float:
+    """Conservative: route is only as safe as its least safe segment."""
+    return min(scores)
+
+
+def _weighted_avg_score(scores: List[float]) -> float:
+    """Weight lower scores more heavily (safety-first approach)."""
+    # Sort scores and give the lower half (rounded up) weight 1.5, the rest
+    # 1.0; both weight sums follow from the split point, so no per-score
+    # weight list is built
+    sorted_scores = sorted(scores)
+    n = len(sorted_scores)
+    lower = (n + 1) // 2
+    weighted_sum = 1.5 * sum(sorted_scores[:lower]) + sum(sorted_scores[lower:])
+    total_weight = 1.5 * lower + (n - lower)
+    return weighted_sum / total_weight
+
+
+# Aggregation method name -> implementation, for aggregate_scores
+_AGGREGATORS = {
+    "average": _average_score,
+    "min": _min_score,
+    "weighted_avg": _weighted_avg_score,
+}
 
 
 def score_to_percentage(score: float) -> str:
@@ -303,7 +452,24 @@ def score_to_percentage(score: float) -> str:
         >>> score_to_percentage(42.3)
         '42%'
     """
-    return f"{round(score)}%"
+    # Half-up rounding via int() truncation; scores are never negative
+    return str(int(score + 0.5)) + "%"
+
+
+# Description for each band (lower bound, text), and the text for every
+# whole score 0-100 built from them once
+_DESCRIPTION_BANDS = (
+    (80, "Excellent safety rating. This route is highly recommended."),
+    (70, "Good safety rating. This route is generally safe."),
+    (60, "Fair safety rating. Exercise caution and stay alert."),
+    (50, "Moderate safety. Exercise normal caution and be aware of surroundings."),
+    (40, "Below average safety. Consider alternative routes if possible."),
+    (0, "Poor safety rating. This route is not recommended. Consider alternatives.")
+)
+_DESCRIPTION_BY_SCORE = tuple(
+    next(text for lower, text in _DESCRIPTION_BANDS if score >= lower)
+    for score in range(101)
+)
 
 
 def get_score_description(score: float) -> str:
@@ -328,18 +494,12 @@ def get_score_description(score: float) -> str:
         >>> get_score_description(35)
         'Poor safety rating. This route is not recommended. Consider alternatives.'
     """
-    if score >= 80:
-        return "Excellent safety rating. This route is highly recommended."
-    elif score >= 70:
-        return "Good safety rating. This route is generally safe."
-    elif score >= 60:
-        return "Fair safety rating. Exercise caution and stay alert."
-    elif score >= 50:
-        return "Moderate safety. Exercise normal caution and be aware of surroundings."
-    elif score >= 40:
-        return "Below average safety. Consider alternative routes if possible."
-    else:
-        return "Poor safety rating. This route is not recommended. Consider alternatives."
+    # The bands start on whole scores, so the integer part picks the entry
+    if score >= 100:
+        return _DESCRIPTION_BY_SCORE[100]
+    if score > 0:
+        return _DESCRIPTION_BY_SCORE[int(score)]
+    return _DESCRIPTION_BY_SCORE[0]
     
 # ============================================================================
 # ROUTE COMPARISON & SELECTION UTILITIES
@@ -7,15 +7,51 @@ safety multipliers based on the hour.
 
 Key Functions:
 - is_night_time: Check if a given time falls within night hours
+- is_night_time_hour / is_night_time_now: Night check for a known hour, or for now
 - get_time_period: Get the time period (morning/afternoon/evening/night)
 - get_safety_multiplier: Get safety adjustment factor based on time
+- get_safety_multiplier_batch: Multipliers for many hours at once
 """
 
+import time
 from datetime import datetime
-from app.constants.safety_thresholds import NIGHT_START_HOUR, NIGHT_END_HOUR
+from typing import Iterable, List, Optional, Tuple
+from app.constants.safety_thresholds import (
+    NIGHT_START_HOUR,
+    NIGHT_END_HOUR,
+    DAY_SAFETY_MULTIPLIER,
+    EVENING_SAFETY_MULTIPLIER,
+    NIGHT_SAFETY_MULTIPLIER,
+    LATE_NIGHT_SAFETY_MULTIPLIER
+)
 
+# (epoch minute, is night) for the last is_night_time_now() check
+_night_now_cache: Tuple[float, bool] = (-1.0, False)
 
-def is_night_time(current_time: datetime = None) -> bool:
+# Bit h set when hour h is night. Handles night spanning midnight (e.g.
+# 21:00-06:00) as well as a window within one day (e.g. 01:00-05:00).
+_NIGHT_MASK = sum(
+    1 << hour
+    for hour in range(24)
+    if (hour >= NIGHT_START_HOUR or hour < NIGHT_END_HOUR
+        if NIGHT_START_HOUR > NIGHT_END_HOUR
+        else NIGHT_START_HOUR <= hour < NIGHT_END_HOUR)
+)
+
+# Time period and safety multiplier for each hour 0-23, built once
+_PERIOD_BY_HOUR = (
+    ("night",) * 6 + ("morning",) * 6 + ("afternoon",) * 6 + ("evening",) * 4 + ("night",) * 2
+)
+_MULTIPLIER_BY_HOUR = (
+    (NIGHT_SAFETY_MULTIPLIER,) * 2 +        # 0-1: night
+    (LATE_NIGHT_SAFETY_MULTIPLIER,) * 4 +   # 2-5: late night
+    (DAY_SAFETY_MULTIPLIER,) * 12 +         # 6-17: day
+    (EVENING_SAFETY_MULTIPLIER,) * 4 +      # 18-21: evening
+    (NIGHT_SAFETY_MULTIPLIER,) * 2          # 22-23: night
+)
+
+
+def is_night_time(current_time: Optional[datetime] = None) -> bool:
     """
     Determine if the given time is considered "night time" for safety purposes.
     
@@ -46,21 +82,46 @@ def is_night_time(current_time: datetime = None) -> bool:
     """
     # If no time provided, use current system time
     if current_time is None:
-        current_time = datetime.now()
+        return is_night_time_now()
+    return is_night_time_hour(current_time.hour)
+
+
+def is_night_time_hour(hour: int) -> bool:
+    """
+    Night check for an hour (0-23) the caller already has, e.g. one hour
+    computed up front for a whole batch of route segments.
+    
+    Hours outside 0-23 count as night, as they do in get_time_period.
     
-    # Extract the hour (0-23)
-    hour = current_time.hour
+    Example:
+        >>> is_night_time_hour(23)
+        True
+        >>> is_night_time_hour(14)
+        False
+    """
+    if 0 <= hour < 24:
+        # Test the hour's bit in the precomputed night mask
+        return bool((_NIGHT_MASK >> hour) & 1)
+    return True
+
+
+def is_night_time_now() -> bool:
+    """
+    Night check for the current local time, cached for the current minute.
     
-    # Handle night time that spans across midnight (e.g., 21:00-06:00)
-    # If NIGHT_START_HOUR (21) > NIGHT_END_HOUR (6), night spans midnight
-    if NIGHT_START_HOUR > NIGHT_END_HOUR:
-        # Night time wraps around midnight
-        # True if hour >= 21 OR hour < 6
-        return hour >= NIGHT_START_HOUR or hour < NIGHT_END_HOUR
-    else:
-        # Night time doesn't wrap (e.g., if it were 1:00-5:00)
-        # True if hour is between start and end
-        return NIGHT_START_HOUR <= hour < NIGHT_END_HOUR
+    The local hour only changes on a minute boundary, so one datetime.now()
+    per minute serves every call in that minute. Uses wall-clock time.time()
+    rather than time.monotonic(), which does not track the clock's minutes.
+    """
+    global _night_now_cache
+    
+    minute = time.time() // 60
+    cached_minute, cached_is_night = _night_now_cache
+    if cached_minute == minute:
+        return cached_is_night
+    is_night = is_night_time_hour(datetime.now().hour)
+    _night_now_cache = (minute, is_night)
+    return is_night
 
 
 def get_time_period(hour: int) -> str:
@@ -99,14 +160,9 @@ def get_time_period(hour: int) -> str:
         >>> period = get_time_period(hour)
         >>> crowd_level = crowd_data[period]  # Get afternoon crowd level
     """
-    if 6 <= hour < 12:
-        return "morning"
-    elif 12 <= hour < 18:
-        return "afternoon"
-    elif 18 <= hour < 22:
-        return "evening"
-    else:
-        return "night"
+    if 0 <= hour < 24:
+        return _PERIOD_BY_HOUR[hour]
+    return "night"
 
 
 def get_safety_multiplier(hour: int) -> float:
@@ -150,25 +206,26 @@ def get_safety_multiplier(hour: int) -> float:
         >>> print(f"Day: {day_score:.0f}, Night: {night_score:.0f}")
         Day: 85, Night: 51
     """
-    from app.constants.safety_thresholds import (
-        DAY_SAFETY_MULTIPLIER,
-        EVENING_SAFETY_MULTIPLIER,
-        NIGHT_SAFETY_MULTIPLIER,
-        LATE_NIGHT_SAFETY_MULTIPLIER
-    )
-    
-    # Daytime: 6 AM to 6 PM (full safety)
-    if 6 <= hour < 18:
-        return DAY_SAFETY_MULTIPLIER
-    
-    # Evening: 6 PM to 10 PM (slight reduction)
-    elif 18 <= hour < 22:
-        return EVENING_SAFETY_MULTIPLIER
-    
-    # Night: 10 PM to 2 AM (significant reduction)
-    elif 22 <= hour <= 23 or 0 <= hour < 2:
-        return NIGHT_SAFETY_MULTIPLIER
-    
-    # Late Night: 2 AM to 6 AM (maximum reduction - most dangerous)
-    else:
-        return LATE_NIGHT_SAFETY_MULTIPLIER
\ No newline at end of file
+    if 0 <= hour < 24:
+        return _MULTIPLIER_BY_HOUR[hour]
+    # Out-of-range hours get the most cautious (late night) multiplier
+    return LATE_NIGHT_SAFETY_MULTIPLIER
+
+
+def get_safety_multiplier_batch(hours: Iterable[int]) -> List[float]:
+    """
+    Batch form of get_safety_multiplier, e.g. for the hours at which each
+    point along a route will be reached.
+    
+    Hours fit in a byte, so long hour series can be kept as bytes or a
+    bytearray (one byte per hour instead of a full int object) and passed
+    in directly; iterating them yields ints.
+    
+    Example:
+        >>> get_safety_multiplier_batch([14, 19, 23, 3])
+        [1.0, 0.85, 0.6, 0.5]
+        >>> get_safety_multiplier_batch(bytes([14, 23]))
+        [1.0, 0.6]
+    """
+    table, fallback = _MULTIPLIER_BY_HOUR, LATE_NIGHT_SAFETY_MULTIPLIER
+    return [table[hour] if 0 <= hour < 24 else fallback for hour in hours]